@@ -1,10 +1,25 @@
 """Resource manager CLI application."""
 
+from importlib import import_module
+from typing import Callable
+
 from cleo.application import Application
+from cleo.commands.command import Command
+from cleo.loaders.factory_command_loader import FactoryCommandLoader
+
+
+COMMANDS = ["config", "download", "status"]
+
+
+def load_command(name: str) -> Callable[[], Command]:
+    """Create a factory that imports and instantiates a command on dispatch."""
+
+    def _load() -> Command:
+        module = import_module(f"resource_manager.cli.commands.{name}_command")
+        command_class = getattr(module, f"{name.title()}Command")
+        return command_class()
 
-from .commands.config_command import ConfigCommand
-from .commands.download_command import DownloadCommand
-from .commands.status_command import StatusCommand
+    return _load
 
 
 class ResourceManagerApplication(Application):
@@ -13,9 +28,10 @@ class ResourceManagerApplication(Application):
     def __init__(self):
         super().__init__("Resource Manager", "0.1.0")
 
-        self.add(ConfigCommand())
-        self.add(DownloadCommand())
-        self.add(StatusCommand())
+        command_loader = FactoryCommandLoader(
+            {name: load_command(name) for name in COMMANDS}
+        )
+        self.set_command_loader(command_loader)
 
 
 def main():
@@ -1,11 +1,11 @@
 """Config command implementation."""
 
-from pathlib import Path
+from functools import cached_property
 from cleo.commands.command import Command
 from cleo.helpers import argument, option
 from typing import Any
 
-from ...core.config import ConfigManager, Config
+from ...core.config import ConfigManager, Config, default_config_dir
 
 
 class ConfigCommand(Command):
@@ -124,81 +124,92 @@ class ConfigCommand(Command):
         except:
             return False
 
+    @cached_property
+    def _config_manager(self) -> ConfigManager:
+        """Configuration manager, created once per command instance."""
+        return ConfigManager(default_config_dir())
+
     def _get_config_manager(self) -> ConfigManager:
         """Get configuration manager."""
-        config_dir = Path.cwd() / ".resource-manager"
-        return ConfigManager(config_dir)
+        return self._config_manager
 
     def _print_config_simple(self, config: Config):
         """Print configuration in a simple format."""
         try:
-            config_dict = config.to_dict()
-            self._print_dict(config_dict, 0)
+            lines = []
+            # Config.items() iterates the data in place; to_dict() would copy it
+            self._format_dict(config, 0, lines)
+            self.line("\n".join(lines))
         except Exception as e:
             self.line_error(f"Error printing config: {e}")
 
-    def _print_dict(self, data: dict, indent: int = 0):
-        """Print dictionary recursively."""
+    def _format_dict(self, data: dict, indent: int, lines: list):
+        """Append dictionary lines recursively."""
+        pad = " " * indent
+        item_pad = " " * (indent + 2)
+        append = lines.append
         for key, value in data.items():
             if isinstance(value, dict):
-                self.line(" " * indent + f"{key}:")
-                self._print_dict(value, indent + 2)
+                append(f"{pad}{key}:")
+                self._format_dict(value, indent + 2, lines)
             elif isinstance(value, list):
-                self.line(" " * indent + f"{key}:")
+                append(f"{pad}{key}:")
                 for i, item in enumerate(value):
                     if isinstance(item, dict):
-                        self.line(" " * (indent + 2) + f"[{i}]:")
-                        self._print_dict(item, indent + 4)
+                        append(f"{item_pad}[{i}]:")
+                        self._format_dict(item, indent + 4, lines)
                     else:
-                        self.line(" " * (indent + 2) + f"[{i}]: {item}")
+                        append(f"{item_pad}[{i}]: {item}")
             else:
-                self.line(" " * indent + f"{key}: {value}")
+                append(f"{pad}{key}: {value}")
 
     def _print_config_pretty(self, config: Config):
         """Print configuration in a pretty format."""
-        self.line("\n<info>Configuration:</info>")
+        lines = ["\n<info>Configuration:</info>"]
+        append = lines.append
 
         # Print providers
-        self.line("\n<comment>Providers:</comment>")
+        append("\n<comment>Providers:</comment>")
 
         # GitHub providers
         github_providers = config.get_providers("github")
         if github_providers:
-            self.line("\n  <info>GitHub:</info>")
+            append("\n  <info>GitHub:</info>")
             for i, provider in enumerate(github_providers):
-                self.line(f"    [{i}] {provider['name']}:")
-                self.line(f"      URL: {provider.get('url', 'N/A')}")
-                self.line(f"      Enabled: {provider.get('enabled', True)}")
-                self.line(f"      Branch: {provider.get('default_branch', 'main')}")
-                self.line(
-                    f"      Resource Dir: {provider.get('resource_dir', 'resources')}"
-                )
-                self.line(f"      Timeout: {provider.get('timeout', 10)}s")
+                p_get = provider.get
+                append(f"    [{i}] {provider['name']}:")
+                append(f"      URL: {p_get('url', 'N/A')}")
+                append(f"      Enabled: {p_get('enabled', True)}")
+                append(f"      Branch: {p_get('default_branch', 'main')}")
+                append(f"      Resource Dir: {p_get('resource_dir', 'resources')}")
+                append(f"      Timeout: {p_get('timeout', 10)}s")
 
         # Local providers
         local_providers = config.get_providers("local")
         if local_providers:
-            self.line("\n  <info>Local:</info>")
+            append("\n  <info>Local:</info>")
             for i, provider in enumerate(local_providers):
-                self.line(f"    [{i}] {provider['name']}:")
-                self.line(f"      Path: {provider.get('path', 'N/A')}")
-                self.line(f"      Enabled: {provider.get('enabled', True)}")
+                append(f"    [{i}] {provider['name']}:")
+                append(f"      Path: {provider.get('path', 'N/A')}")
+                append(f"      Enabled: {provider.get('enabled', True)}")
 
         # Print resource patterns
-        self.line("\n<comment>Resource Patterns:</comment>")
+        append("\n<comment>Resource Patterns:</comment>")
         include_patterns = config.get("resources.include_patterns", [])
         exclude_patterns = config.get("resources.exclude_patterns", [])
 
         if include_patterns:
-            self.line(f"  Include: {', '.join(include_patterns)}")
+            append(f"  Include: {', '.join(include_patterns)}")
         if exclude_patterns:
-            self.line(f"  Exclude: {', '.join(exclude_patterns)}")
+            append(f"  Exclude: {', '.join(exclude_patterns)}")
 
         # Print cache settings
         cache = config.get("cache", {})
         if cache:
-            self.line("\n<comment>Cache:</comment>")
-            self.line(f"  Enabled: {cache.get('enabled', True)}")
-            self.line(f"  TTL: {cache.get('ttl', 3600)}s")
+            append("\n<comment>Cache:</comment>")
+            append(f"  Enabled: {cache.get('enabled', True)}")
+            append(f"  TTL: {cache.get('ttl', 3600)}s")
             if "dir" in cache:
-                self.line(f"  Directory: {cache['dir']}")
+                append(f"  Directory: {cache['dir']}")
+
+        self.line("\n".join(lines))
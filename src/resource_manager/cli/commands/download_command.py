@@ -1,12 +1,44 @@
 """Download command implementation."""
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
 from cleo.commands.command import Command
 from cleo.helpers import argument, option
 
-from resource_manager.core.config import ConfigManager
-from resource_manager.core.provider_getter import get_provider, get_all_providers
+from resource_manager.core.config import ConfigManager, default_config_dir
+from resource_manager.core.provider_getter import (
+    get_all_providers,
+    get_provider_by_name,
+)
+
+
+def _group_by_target(providers, target_dir):
+    """Group providers whose target directories overlap.
+
+    Providers share a group when their targets are the same directory or
+    one lies inside the other, so a clean in one cannot race with another's
+    download. Providers keep their order within each group.
+    """
+    keys = []
+    for provider in providers:
+        provider_target = target_dir or getattr(provider, "target_dir", None)
+        keys.append(Path(os.path.abspath(provider_target)) if provider_target else None)
+
+    # Sorted by parts, every directory is directly followed by its descendants
+    roots = {}
+    root = None
+    for key in sorted({k for k in keys if k is not None}, key=lambda k: k.parts):
+        if root is None or key.parts[: len(root.parts)] != root.parts:
+            root = key
+        roots[key] = root
+
+    groups = {}
+    for provider, key in zip(providers, keys):
+        groups.setdefault(roots.get(key), []).append(provider)
+    return list(groups.values())
 
 
 class DownloadCommand(Command):
@@ -119,9 +151,7 @@ class DownloadCommand(Command):
 
             if downloaded_files:
                 if not self.option("quiet"):
-                    self.info(f"Downloaded {len(downloaded_files)} files:")
-                    for file_path in sorted(downloaded_files):
-                        self.line(f"  - {file_path}")
+                    self.line(self._format_downloaded(downloaded_files))
                 return 0
             else:
                 self.line(
@@ -153,86 +183,115 @@ class DownloadCommand(Command):
         clean = not self.option("no-clean")
 
         if not self.option("quiet"):
-            self.info(
-                f"Downloading from {len(enabled_providers)} providers to '{target_dir}'..."
-            )
+            out = [
+                f"<info>Downloading from {len(enabled_providers)} providers to '{target_dir}'...</info>"
+            ]
             if pattern != "*":
-                self.line(f"Pattern: {pattern}")
-            self.line(f"Recursive: {recursive}, Clean: {clean}")
-
+                out.append(f"Pattern: {pattern}")
+            out.append(f"Recursive: {recursive}, Clean: {clean}")
+            self.line("\n".join(out))
+
+        # With clean, providers with overlapping target directories run one
+        # after another; without it, downloads never delete and all run at once.
+        if clean:
+            groups = _group_by_target(enabled_providers, target_dir)
+        else:
+            groups = [[provider] for provider in enabled_providers]
+
+        quiet = self.option("quiet")
+        lock = threading.Lock()
         total_downloaded = 0
         failed_providers = []
 
-        for provider in enabled_providers:
-            try:
-                if not self.option("quiet"):
-                    self.line(f"\n<comment>Provider: {provider.name}</comment>")
-
-                downloaded_files = provider.download_folder(
-                    target_dir, pattern, recursive=recursive, clean=clean
-                )
-
-                if downloaded_files:
-                    total_downloaded += len(downloaded_files)
-                    if not self.option("quiet"):
-                        self.info(f"Downloaded {len(downloaded_files)} files:")
-                        for file_path in sorted(downloaded_files):
-                            self.line(f"  - {file_path}")
-                else:
-                    if not self.option("quiet"):
-                        self.line("No files downloaded")
-
-            except Exception as e:
-                failed_providers.append((provider.name, str(e)))
-                self.line_error(f"Failed to download from '{provider.name}': {str(e)}")
+        def download_group(group):
+            nonlocal total_downloaded
+            for provider in group:
+                try:
+                    downloaded_files = provider.download_folder(
+                        target_dir, pattern, recursive=recursive, clean=clean
+                    )
+                except Exception as e:
+                    with lock:
+                        failed_providers.append((provider.name, str(e)))
+                        self.line_error(
+                            f"Failed to download from '{provider.name}': {str(e)}"
+                        )
+                    continue
+
+                with lock:
+                    if downloaded_files:
+                        total_downloaded += len(downloaded_files)
+                    if not quiet:
+                        out = [f"\n<comment>Provider: {provider.name}</comment>"]
+                        if downloaded_files:
+                            out.append(self._format_downloaded(downloaded_files))
+                        else:
+                            out.append("No files downloaded")
+                        self.line("\n".join(out))
+
+        with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+            for _ in executor.map(download_group, groups):
+                pass
 
         # Summary
         if not self.option("quiet"):
-            self.line(f"\n<info>Summary:</info>")
-            self.line(f"Total files downloaded: {total_downloaded}")
+            out = [
+                "\n<info>Summary:</info>",
+                f"Total files downloaded: {total_downloaded}",
+            ]
             if failed_providers:
-                self.line(f"Failed providers: {len(failed_providers)}")
-                for name, error in failed_providers:
-                    self.line(f"  - {name}: {error}")
+                out.append(f"Failed providers: {len(failed_providers)}")
+                out.extend(f"  - {name}: {error}" for name, error in failed_providers)
+            self.line("\n".join(out))
 
         return 0 if not failed_providers else 1
 
     def _get_provider(self, config, provider_name: str):
         """Get provider instance by name."""
-        for provider_type in ["github", "local"]:
-            provider = get_provider(config, provider_type, provider_name)
-            if provider:
-                return provider
-        return None
+        return get_provider_by_name(config, provider_name)
 
     def _show_available_providers(self, config):
         """Show available providers."""
         providers = get_all_providers(config)
         if providers:
-            self.line("\nAvailable providers:")
+            out = ["\nAvailable providers:"]
             for provider in providers:
                 status = "enabled" if provider.enabled else "disabled"
                 available = "available" if provider.is_available() else "unavailable"
-                self.line(f"  - {provider.name} ({status}, {available})")
+                out.append(f"  - {provider.name} ({status}, {available})")
+            self.line("\n".join(out))
+
+    def _format_downloaded(self, downloaded_files) -> str:
+        """Format the list of downloaded files as one block of output."""
+        out = [f"<info>Downloaded {len(downloaded_files)} files:</info>"]
+        out.extend(f"  - {file_path}" for file_path in sorted(downloaded_files))
+        return "\n".join(out)
 
     def _validate_target_dir(self, target_dir: str) -> bool:
         """Validate target directory."""
-        target_path = Path(target_dir)
-
-        # Check if target exists and is not empty
-        if target_path.exists():
-            if target_path.is_file():
-                self.line_error(f"Target path is a file, not a directory: {target_dir}")
-                return False
-
-            if any(target_path.iterdir()) and not self.option("force"):
-                self.line_error(f"Target directory is not empty: {target_dir}")
-                self.line("Use --force to download anyway")
-                return False
+        # Check if target exists and is not empty; scandir stops at the
+        # first entry without building Path objects
+        try:
+            with os.scandir(target_dir) as entries:
+                non_empty = next(entries, None) is not None
+        except FileNotFoundError:
+            return True
+        except NotADirectoryError:
+            self.line_error(f"Target path is a file, not a directory: {target_dir}")
+            return False
+
+        if non_empty and not self.option("force"):
+            self.line_error(f"Target directory is not empty: {target_dir}")
+            self.line("Use --force to download anyway")
+            return False
 
         return True
 
+    @cached_property
+    def _config_manager(self) -> ConfigManager:
+        """Configuration manager, created once per command instance."""
+        return ConfigManager(default_config_dir())
+
     def _get_config_manager(self) -> ConfigManager:
         """Get configuration manager."""
-        config_dir = Path.cwd() / ".resource-manager"
-        return ConfigManager(config_dir)
+        return self._config_manager
@@ -1,11 +1,15 @@
 """Status command implementation."""
 
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from cleo.commands.command import Command
 from cleo.helpers import argument, option
 
-from ...core.config import ConfigManager
-from resource_manager.core.provider_getter import get_provider, get_all_providers
+from ...core.config import ConfigManager, default_config_dir
+from resource_manager.core.provider_getter import (
+    get_all_providers,
+    get_provider_by_name,
+)
 
 
 class StatusCommand(Command):
@@ -82,11 +86,20 @@ class StatusCommand(Command):
         # Summary table
         enabled_count = sum(1 for p in providers if p.enabled)
         available_count = 0
+        availability = {}
 
         if self.option("check-connection"):
             self.line("Checking connections...")
+            # Probe all providers at once; the results are reused for details
+            with ThreadPoolExecutor(max_workers=min(32, len(providers))) as executor:
+                results = list(executor.map(self._check_available, providers))
+            availability = dict(zip(providers, results))
             available_count = sum(
-                1 for p in providers if p.enabled and p.is_available()
+                1
+                for p in providers
+                if p.enabled
+                and availability[p]
+                and not isinstance(availability[p], Exception)
             )
 
         self.line(f"Total providers: {len(providers)}")
@@ -99,58 +112,49 @@ class StatusCommand(Command):
         # Provider details
         for provider in providers:
             self.line(f"<comment>▶ {provider.name}</comment>")
-            self._print_provider_details(provider, indent=2)
+            self._print_provider_details(
+                provider, indent=2, available=availability.get(provider)
+            )
             self.line("")
 
         return 0
 
-    def _print_provider_details(self, provider, indent: int = 0) -> None:
-        """Print detailed information about a provider."""
+    def _check_available(self, provider):
+        """Return provider availability, or the exception raised checking it."""
+        try:
+            return provider.is_available()
+        except Exception as e:
+            return e
+
+    def _print_provider_details(
+        self, provider, indent: int = 0, available=None
+    ) -> None:
+        """Print detailed information about a provider.
+
+        available is a precomputed _check_available() result; when omitted,
+        the connection is checked here if requested.
+        """
         prefix = " " * indent
 
         # Basic info
-        provider_type = provider.__class__.__name__.replace("Provider", "").lower()
-        self.line(f"{prefix}Type: {provider_type}")
+        self.line(f"{prefix}Type: {provider.PROVIDER_TYPE}")
         self.line(f"{prefix}Enabled: {'Yes' if provider.enabled else 'No'}")
 
         # Connection status
         if self.option("check-connection") or self.argument("provider_name"):
-            try:
-                is_available = provider.is_available()
-                status_color = "info" if is_available else "error"
-                status_text = "Available" if is_available else "Unavailable"
+            if available is None:
+                available = self._check_available(provider)
+            if isinstance(available, Exception):
+                self.line(f"{prefix}Status: <error>Error - {str(available)}</error>")
+            else:
+                status_color = "info" if available else "error"
+                status_text = "Available" if available else "Unavailable"
                 self.line(
                     f"{prefix}Status: <{status_color}>{status_text}</{status_color}>"
                 )
-            except Exception as e:
-                self.line(f"{prefix}Status: <error>Error - {str(e)}</error>")
 
         # Provider-specific details
-        if hasattr(provider, "url"):  # GitHub provider
-            self.line(f"{prefix}URL: {provider.url}")
-            if self.option("verbose"):
-                self.line(f"{prefix}Owner: {provider.owner}")
-                self.line(f"{prefix}Repository: {provider.repo}")
-                self.line(f"{prefix}Branch: {provider.branch}")
-                self.line(f"{prefix}Resource Directory: {provider.resource_dir}")
-                self.line(f"{prefix}Timeout: {provider.timeout}s")
-
-        elif hasattr(provider, "base_path"):  # Local provider
-            self.line(f"{prefix}Path: {provider.base_path}")
-            if self.option("verbose"):
-                path_exists = provider.base_path.exists()
-                path_status = "exists" if path_exists else "missing"
-                path_color = "info" if path_exists else "error"
-                self.line(
-                    f"{prefix}Path Status: <{path_color}>{path_status}</{path_color}>"
-                )
-
-                if path_exists and provider.base_path.is_dir():
-                    try:
-                        file_count = len(list(provider.base_path.glob("*")))
-                        self.line(f"{prefix}Files: {file_count}")
-                    except Exception:
-                        self.line(f"{prefix}Files: Unable to count")
+        provider.render_details(self, prefix, self.option("verbose"))
 
         # Pattern filters
         if self.option("verbose"):
@@ -165,11 +169,7 @@ class StatusCommand(Command):
 
     def _get_provider(self, config, provider_name: str):
         """Get provider instance by name."""
-        for provider_type in ["github", "local"]:
-            provider = get_provider(config, provider_type, provider_name)
-            if provider:
-                return provider
-        return None
+        return get_provider_by_name(config, provider_name)
 
     def _show_available_providers(self, config):
         """Show available provider names."""
@@ -181,7 +181,11 @@ class StatusCommand(Command):
         else:
             self.line("\nNo providers configured.")
 
+    @cached_property
+    def _config_manager(self) -> ConfigManager:
+        """Configuration manager, created once per command instance."""
+        return ConfigManager(default_config_dir())
+
     def _get_config_manager(self) -> ConfigManager:
         """Get configuration manager."""
-        config_dir = Path.cwd() / ".resource-manager"
-        return ConfigManager(config_dir)
+        return self._config_manager
@@ -1,72 +1,120 @@
 """Configuration management core functionality."""
 
-import json
+import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, List, Iterator, Tuple
 
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(data: Any) -> bytes:
+        # OPT_NON_STR_KEYS: like json, write non-str keys as strings
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+except ImportError:  # orjson not available, fall back to stdlib json
+    import json
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
+
+# One path segment: name, optional [index] (negative counts from the end),
+# then "." or end of key
+_PATH_SEGMENT_RE = re.compile(r"([^.\[\]]*)(?:\[(-?\d+)\])?(?:(\.)|\Z)")
+
+
+@lru_cache(maxsize=512)
+def _parse_path(key: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """Parse a dot-notation key into (name, index) pairs.
+
+    "providers.github[0].name" -> (("providers", None), ("github", 0), ("name", None))
+    """
+    path = []
+    pos = 0
+    while True:
+        match = _PATH_SEGMENT_RE.match(key, pos)
+        if match is None:
+            raise ValueError(f"Invalid configuration key: {key}")
+        name, index, separator = match.groups()
+        path.append((name, None if index is None else int(index)))
+        if separator is None:
+            break
+        pos = match.end()
+    return tuple(path)
+
+
+def _ensure_index(config: Dict[str, Any], name: str, index: int) -> List[Any]:
+    """Ensure config[name] is a list long enough to hold index."""
+    items = config.setdefault(name, [])
+    while len(items) <= index:
+        items.append({})
+    return items
+
+
+VALID_AUTH_METHODS = ["default", "auto", "dotenv", "gitcli"]
+
+# provider type -> (display label, required field, required field label)
+_PROVIDER_SCHEMAS = {
+    "github": ("GitHub", "url", "URL"),
+    "local": ("Local", "path", "path"),
+}
+
 
 class Config:
     """Configuration wrapper class."""
 
+    __slots__ = ("_config",)
+
     def __init__(self, config_data: Dict[str, Any]):
         self._config = config_data or {}
-        self._validate_config()
+        self._ensure_defaults()
+        self.validate()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value using dot notation."""
-        keys = key.split(".")
+        if "." not in key and "[" not in key:
+            return self._config.get(key, default)
+
         value = self._config
 
-        for k in keys:
-            if isinstance(value, dict):
-                # Handle array index access (e.g. "github[0]")
-                if "[" in k and "]" in k:
-                    array_key, index = k.split("[")
-                    index = int(index.rstrip("]"))
-                    if array_key not in value or not isinstance(value[array_key], list):
-                        return default
-                    if index >= len(value[array_key]):
-                        return default
-                    value = value[array_key][index]
-                else:
-                    value = value.get(k, default)
-            else:
+        for name, index in _parse_path(key):
+            if not isinstance(value, dict):
                 return default
+            if index is None:
+                value = value.get(name, default)
+            else:
+                # Handle array index access (e.g. "github[0]")
+                items = value.get(name)
+                if not isinstance(items, list) or not -len(items) <= index < len(items):
+                    return default
+                value = items[index]
 
         return value
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value using dot notation."""
-        keys = key.split(".")
+        path = _parse_path(key)
         config = self._config
 
-        for k in keys[:-1]:
-            if "[" in k and "]" in k:
-                array_key, index = k.split("[")
-                index = int(index.rstrip("]"))
-                if array_key not in config:
-                    config[array_key] = []
-                while len(config[array_key]) <= index:
-                    config[array_key].append({})
-                config = config[array_key][index]
+        for name, index in path[:-1]:
+            if index is None:
+                config = config.setdefault(name, {})
             else:
-                if k not in config:
-                    config[k] = {}
-                config = config[k]
-
-        last_key = keys[-1]
-        if "[" in last_key and "]" in last_key:
-            array_key, index = last_key.split("[")
-            index = int(index.rstrip("]"))
-            if array_key not in config:
-                config[array_key] = []
-            while len(config[array_key]) <= index:
-                config[array_key].append({})
-            config[array_key][index] = value
-        else:
-            config[last_key] = value
+                config = _ensure_index(config, name, index)[index]
 
-        self._validate_config()
+        name, index = path[-1]
+        if index is None:
+            config[name] = value
+        else:
+            _ensure_index(config, name, index)[index] = value
 
     def items(self) -> Iterator[Tuple[str, Any]]:
         """Get all configuration items as iterator of (key, value) pairs."""
@@ -82,81 +130,98 @@ class Config:
 
     def get_providers(self, provider_type: str) -> List[Dict[str, Any]]:
         """Get providers of specific type."""
-        return self.get(f"providers.{provider_type}", [])
+        return self._config.get("providers", {}).get(provider_type, [])
 
     def get_enabled_providers(self, provider_type: str) -> List[Dict[str, Any]]:
         """Get enabled providers of specific type."""
-        providers = self.get_providers(provider_type)
+        providers = self._config.get("providers", {}).get(provider_type, ())
         return [p for p in providers if p.get("enabled", True)]
 
-    def _validate_config(self) -> None:
-        """Validate configuration structure."""
+    def get_provider_config(
+        self, provider_type: str, provider_name: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get provider configuration by type and name.
+
+        Scans only the list for provider_type. Provider entries are live
+        dicts that callers may edit in place, so no lookup index is kept.
+        """
+        for provider in self._config.get("providers", {}).get(provider_type, ()):
+            if provider.get("name") == provider_name:
+                return provider
+        return None
+
+    def validate(self) -> None:
+        """Validate the whole configuration structure.
+
+        Mutations through set(), item assignment or returned containers are
+        not validated individually; ConfigManager.save_config() validates
+        the config before writing it.
+        """
         if not isinstance(self._config, dict):
             raise ValueError("Configuration must be a dictionary")
 
-        # Initialize providers if not present
-        if "providers" not in self._config:
-            self._config["providers"] = {"github": [], "local": []}
+        self._validate_providers()
+        self._validate_auth()
+
+    def _ensure_defaults(self) -> None:
+        """Initialize missing providers and auth sections."""
+        if not isinstance(self._config, dict):
+            return
+
+        providers = self._config.setdefault("providers", {"github": [], "local": []})
+        if isinstance(providers, dict):
+            for provider_type in _PROVIDER_SCHEMAS:
+                providers.setdefault(provider_type, [])
+
+        auth = self._config.setdefault("auth", {"github": {"method": "auto"}})
+        if isinstance(auth, dict):
+            auth.setdefault("github", {"method": "auto"})
 
-        # Validate providers
-        providers = self._config["providers"]
+    def _validate_providers(self) -> None:
+        """Validate providers section."""
+        providers = self._config.get("providers", {})
         if not isinstance(providers, dict):
             raise ValueError("Providers must be a dictionary")
 
-        # Initialize provider types if not present
-        if "github" not in providers:
-            providers["github"] = []
-        if "local" not in providers:
-            providers["local"] = []
-
-        # Validate GitHub providers
-        github_providers = providers["github"]
-        if not isinstance(github_providers, list):
-            raise ValueError("GitHub providers must be a list")
-
-        for provider in github_providers:
-            if not isinstance(provider, dict):
-                raise ValueError("GitHub provider must be a dictionary")
-            if "name" not in provider:
-                raise ValueError("GitHub provider must have a name")
-            if "url" not in provider:
-                raise ValueError("GitHub provider must have a URL")
-
-        # Validate Local providers
-        local_providers = providers["local"]
-        if not isinstance(local_providers, list):
-            raise ValueError("Local providers must be a list")
-
-        for provider in local_providers:
-            if not isinstance(provider, dict):
-                raise ValueError("Local provider must be a dictionary")
-            if "name" not in provider:
-                raise ValueError("Local provider must have a name")
-            if "path" not in provider:
-                raise ValueError("Local provider must have a path")
-
-        # Initialize and validate auth section
-        if "auth" not in self._config:
-            self._config["auth"] = {"github": {"method": "auto"}}
-
-        auth = self._config["auth"]
+        for provider_type in _PROVIDER_SCHEMAS:
+            self._validate_provider_list(
+                provider_type, providers.get(provider_type, [])
+            )
+
+    def _validate_provider_list(self, provider_type: str, providers: Any) -> None:
+        """Validate list of providers of specific type."""
+        label = _PROVIDER_SCHEMAS[provider_type][0]
+        if not isinstance(providers, list):
+            raise ValueError(f"{label} providers must be a list")
+
+        for provider in providers:
+            self._validate_providers_entry(provider_type, provider)
+
+    def _validate_providers_entry(self, provider_type: str, provider: Any) -> None:
+        """Validate a single provider entry."""
+        label, required_key, required_label = _PROVIDER_SCHEMAS[provider_type]
+        if not isinstance(provider, dict):
+            raise ValueError(f"{label} provider must be a dictionary")
+        if "name" not in provider:
+            raise ValueError(f"{label} provider must have a name")
+        if required_key not in provider:
+            raise ValueError(f"{label} provider must have a {required_label}")
+
+    def _validate_auth(self) -> None:
+        """Validate auth section."""
+        auth = self._config.get("auth", {})
         if not isinstance(auth, dict):
             raise ValueError("Auth must be a dictionary")
 
-        # Initialize GitHub auth if not present
-        if "github" not in auth:
-            auth["github"] = {"method": "auto"}
-
-        github_auth = auth["github"]
+        github_auth = auth.get("github", {})
         if not isinstance(github_auth, dict):
             raise ValueError("GitHub auth must be a dictionary")
 
         # Validate auth method
         auth_method = github_auth.get("method", "auto")
-        valid_methods = ["default", "auto", "dotenv", "gitcli"]
-        if auth_method not in valid_methods:
+        if auth_method not in VALID_AUTH_METHODS:
             raise ValueError(
-                f"Invalid auth method '{auth_method}'. Must be one of: {', '.join(valid_methods)}"
+                f"Invalid auth method '{auth_method}'. Must be one of: {', '.join(VALID_AUTH_METHODS)}"
             )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -170,7 +235,6 @@ class Config:
     def __setitem__(self, key: str, value: Any) -> None:
         """Set configuration value using dictionary syntax."""
         self._config[key] = value
-        self._validate_config()
 
     def __contains__(self, key: str) -> bool:
         """Check if key exists in configuration."""
@@ -189,6 +253,27 @@ class Config:
         return bool(self._config)
 
 
+@lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int, size: int) -> bytes:
+    """Read raw config file contents, cached by path, mtime and size.
+
+    Only the bytes are cached: every load parses them into a fresh dict,
+    since Config fills in defaults and mutates its data in place.
+    """
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def default_config_dir() -> Path:
+    """Default configuration directory: .resource-manager under the cwd.
+
+    Resolved on every call, so callers that change directory get the new
+    location. CLI commands resolve it once when creating their
+    ConfigManager.
+    """
+    return Path.cwd() / ".resource-manager"
+
+
 class ConfigManager:
     """Core configuration management functionality."""
 
@@ -198,11 +283,12 @@ class ConfigManager:
         config_file: str = "config.json",
     ):
         if config_dir is None:
-            config_dir = Path.cwd() / ".resource-manager"
+            config_dir = default_config_dir()
 
         self.config_dir = config_dir
         self.config_file = config_file
         self.config_path = config_dir / config_file
+        self._dir_ready = False  # config_dir known to exist
 
     def init(self) -> None:
         """Initialize empty configuration."""
@@ -211,22 +297,38 @@ class ConfigManager:
 
     def load_config(self) -> Optional[Config]:
         """Load configuration from file."""
-        if not self.config_path.exists():
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
             return None
 
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return Config(data)
+            data = _read_config_file(
+                str(self.config_path), stat.st_mtime_ns, stat.st_size
+            )
+            return Config(_loads(data))
         except Exception as e:
             raise RuntimeError(f"Failed to load config: {e}")
 
     def save_config(self, config: Config) -> None:
         """Save configuration to file."""
         try:
-            self.config_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(config.to_dict(), f, indent=2)
+            config.validate()
+            data = _dumps(config._config)
+            if not self._dir_ready:
+                self.config_dir.mkdir(parents=True, exist_ok=True)
+                self._dir_ready = True
+
+            # Write next to the target and rename, so a crash mid-write
+            # never leaves a truncated config behind
+            temp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+            try:
+                temp_path.write_bytes(data)
+                os.replace(temp_path, self.config_path)
+            except BaseException:
+                temp_path.unlink(missing_ok=True)
+                raise
+            _read_config_file.cache_clear()
         except Exception as e:
             raise RuntimeError(f"Failed to save config: {e}")
 
@@ -269,64 +371,20 @@ class ConfigManager:
             return False
 
         try:
-            # Basic structure validation
-            if not isinstance(config.to_dict(), dict):
-                return False
-
-            # Check if providers exist
-            providers = config.get("providers")
-            if not isinstance(providers, dict):
-                return False
-
-            # Check GitHub providers
-            github_providers = config.get("providers.github", [])
-            if not isinstance(github_providers, list):
-                return False
-
-            for provider in github_providers:
-                if not isinstance(provider, dict):
-                    return False
-                if "name" not in provider or "url" not in provider:
-                    return False
-
-            # Check local providers
-            local_providers = config.get("providers.local", [])
-            if not isinstance(local_providers, list):
-                return False
-
-            for provider in local_providers:
-                if not isinstance(provider, dict):
-                    return False
-                if "name" not in provider or "path" not in provider:
-                    return False
-
-            # Check auth section
-            auth = config.get("auth", {})
-            if auth and not isinstance(auth, dict):
-                return False
-
-            # Check GitHub auth
-            github_auth = config.get("auth.github", {})
-            if github_auth:
-                if not isinstance(github_auth, dict):
-                    return False
-
-                auth_method = github_auth.get("method", "auto")
-                valid_methods = ["default", "auto", "dotenv", "gitcli"]
-                if auth_method not in valid_methods:
-                    return False
-
-            return True
-
-        except Exception:
+            config.validate()
+        except ValueError:
             return False
 
+        return True
+
     def get_config_info(self) -> Dict[str, Any]:
         """Get configuration information."""
+        # load_config returns None only when the file is missing, so its
+        # stat doubles as the existence check
         config = self.load_config()
         return {
             "path": str(self.config_path),
-            "exists": self.config_path.exists(),
+            "exists": config is not None,
             "valid": self.validate_config(config) if config else False,
             "has_providers": (
                 bool(config and config.get("providers")) if config else False
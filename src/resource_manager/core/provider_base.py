@@ -1,12 +1,89 @@
 """Resource provider core functionality."""
 
+import fnmatch
+import os
+import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Protocol, Dict, Any
-from pathspec import PathSpec
-from pathspec.patterns import GitWildMatchPattern
+from typing import Callable, List, Optional, Protocol, Dict, Any, Tuple
 from .config import Config
 
+_NAMED_GROUP_RE = re.compile(r"\(\?P<\w+>")
+_GLOB_CHARS_RE = re.compile(r"[*?\[]")
+
+
+def _read_umask() -> int:
+    """Return the process umask (os.umask can only read it by setting it)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Mode for files written through a temp file. NamedTemporaryFile creates
+# them 0600; read once at import because os.umask is not thread-safe.
+_NEW_FILE_MODE = 0o666 & ~_read_umask()
+
+
+@lru_cache(maxsize=64)
+def _pattern_predicate(pattern: str) -> Callable[[str], bool]:
+    """Build a filename predicate for an fnmatch-style pattern.
+
+    Literal names and plain "*suffix" / "prefix*" patterns are matched with
+    string operations; anything else uses the translated fnmatch regex.
+    """
+    if pattern == "*":
+        return lambda filename: True
+
+    pattern = os.path.normcase(pattern)
+    body = pattern.strip("*")
+    if not _GLOB_CHARS_RE.search(body):
+        if pattern == body:
+            return lambda filename: os.path.normcase(filename) == body
+        if pattern == "*" + body:
+            return lambda filename: os.path.normcase(filename).endswith(body)
+        if pattern == body + "*":
+            return lambda filename: os.path.normcase(filename).startswith(body)
+
+    regex = re.compile(fnmatch.translate(pattern))
+    return lambda filename: regex.match(os.path.normcase(filename)) is not None
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Optional[Callable[[str], bool]]:
+    """Compile gitignore-style patterns into a single match predicate.
+
+    Patterns are merged into one alternation regex so each path is matched
+    in a single pass. Negated ("!") patterns depend on match order, so
+    those lists keep PathSpec's own last-match-wins evaluation. Results are
+    cached by pattern tuple, so providers sharing the global resource
+    patterns compile them once.
+    """
+    if not patterns:
+        return None
+
+    # Imported here so configs without patterns never load pathspec
+    from pathspec import PathSpec
+    from pathspec.patterns import GitWildMatchPattern
+    from pathspec.util import normalize_file
+
+    spec = PathSpec.from_lines(GitWildMatchPattern, patterns)
+    regexes = [p.regex.pattern for p in spec.patterns if p.include is not None]
+    if not regexes or any(p.include is False for p in spec.patterns):
+        return spec.match_file
+
+    try:
+        combined = re.compile(
+            "|".join(f"(?:{_NAMED_GROUP_RE.sub('(?:', r)})" for r in regexes)
+        )
+    except re.error:
+        return spec.match_file
+
+    def match(path: str) -> bool:
+        return combined.match(normalize_file(path)) is not None
+
+    return match
+
 
 class ResourceProvider(Protocol):
     """Resource provider interface for folder download/sync operations."""
@@ -56,6 +133,20 @@ class ResourceProvider(Protocol):
 class Provider(ABC):
     """Base provider class for folder download/sync operations."""
 
+    # Provider type as used in the config's "providers" section
+    PROVIDER_TYPE = ""
+
+    __slots__ = (
+        "config",
+        "provider_config",
+        "name",
+        "enabled",
+        "_include_patterns",
+        "_exclude_patterns",
+        "_include_match",
+        "_exclude_match",
+    )
+
     def __init__(self, config: Config, provider_config: Dict[str, Any]):
         self.config = config
         self.provider_config = provider_config
@@ -66,6 +157,10 @@ class Provider(ABC):
             "resources.exclude_patterns", [".git", "__pycache__", "*.pyc"]
         )
 
+        # Compile include/exclude patterns once per provider
+        self._include_match = _compile_patterns(tuple(self._include_patterns))
+        self._exclude_match = _compile_patterns(tuple(self._exclude_patterns))
+
     @abstractmethod
     def download_folder(
         self,
@@ -87,65 +182,42 @@ class Provider(ABC):
         """Check if provider is available."""
         pass
 
+    @abstractmethod
+    def render_details(self, output, prefix: str, verbose: bool) -> None:
+        """Write provider-specific status lines with output.line()."""
+        pass
+
     def _ensure_target_dir(self, target_dir: str) -> Path:
         """Ensure target directory exists and return Path object."""
         target_path = Path(target_dir)
         target_path.mkdir(parents=True, exist_ok=True)
         return target_path
 
-    def _matches_pattern(self, filename: str, pattern: str) -> bool:
-        """Check if filename matches pattern."""
-        if pattern == "*":
-            return True
-
-        import fnmatch
+    def _create_parent_dirs(self, target_path: Path, relative_paths: List[str]) -> None:
+        """Create the parent directories of relative_paths under target_path.
 
-        return fnmatch.fnmatch(filename, pattern)
+        Each directory is created once, parents first, so per-file writes
+        do not need their own mkdir calls.
+        """
+        dirs = {path.rpartition("/")[0] for path in relative_paths}
+        dirs.discard("")
+        for directory in sorted(dirs):
+            (target_path / directory).mkdir(parents=True, exist_ok=True)
 
     def _filter_file_paths(self, file_paths: List[str]) -> List[str]:
         """Filter file paths based on include/exclude patterns."""
         if not file_paths:
             return []
 
-        files = file_paths.copy()
-
-        # Apply include patterns first
-        if self._include_patterns:
-            include_spec = PathSpec.from_lines(
-                GitWildMatchPattern, self._include_patterns
-            )
-            files = [f for f in files if include_spec.match_file(f)]
-
-        # Then apply exclude patterns
-        if self._exclude_patterns:
-            exclude_spec = PathSpec.from_lines(
-                GitWildMatchPattern, self._exclude_patterns
-            )
-            files = [f for f in files if not exclude_spec.match_file(f)]
-
-        return files
-
-    def _save_file(self, target_path: Path, content: str) -> bool:
-        """Save content to file. Returns True if successful."""
-        try:
-            # Ensure parent directory exists
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write content to file
-            target_path.write_text(content, encoding="utf-8")
-            return True
-        except Exception as e:
-            print(f"Warning: Failed to save file {target_path}: {e}")
-            return False
-
-    def _should_update_file(self, target_path: Path, remote_content: str) -> bool:
-        """Check if local file should be updated with remote content."""
-        if not target_path.exists():
-            return True
-
-        try:
-            local_content = target_path.read_text(encoding="utf-8")
-            return local_content != remote_content
-        except Exception:
-            # If we can't read local file, assume we should update
-            return True
+        include_match = self._include_match
+        exclude_match = self._exclude_match
+        if include_match is None and exclude_match is None:
+            return file_paths
+
+        # Single pass: keep files matching include patterns and no exclude pattern
+        return [
+            f
+            for f in file_paths
+            if (include_match is None or include_match(f))
+            and (exclude_match is None or not exclude_match(f))
+        ]
@@ -1,39 +1,60 @@
 """Resource provider core functionality."""
 
-
 from typing import List, Optional
 from .config import Config
-from resource_manager.providers.github.core import GitHubProvider
-from resource_manager.providers.local import LocalProvider
 from resource_manager.core.provider_base import Provider
 
+# Provider modules are imported on first use: the GitHub provider pulls in
+# requests, which local-only configs never need.
+
 
 def get_provider(
     config: Config, provider_type: str, provider_name: str
 ) -> Optional[Provider]:
     """Get provider instance by type and name."""
-    providers = config.get_providers(provider_type)
+    provider_config = config.get_provider_config(provider_type, provider_name)
+    if provider_config is None:
+        return None
+
+    if provider_type == "github":
+        from resource_manager.providers.github.core import GitHubProvider
 
-    for provider_config in providers:
-        if provider_config.get("name") == provider_name:
-            if provider_type == "github":
-                return GitHubProvider(config, provider_config)
-            elif provider_type == "local":
-                return LocalProvider(config, provider_config)
+        return GitHubProvider(config, provider_config)
+    elif provider_type == "local":
+        from resource_manager.providers.local import LocalProvider
+
+        return LocalProvider(config, provider_config)
 
     return None
 
 
+def get_provider_by_name(config: Config, provider_name: str) -> Optional[Provider]:
+    """Get provider instance by name, checking GitHub then local providers."""
+    for provider_type in ("github", "local"):
+        provider = get_provider(config, provider_type, provider_name)
+        if provider is not None:
+            return provider
+    return None
+
+
 def get_all_providers(config: Config) -> List[Provider]:
     """Get all enabled providers."""
     providers = []
 
     # Get GitHub providers
-    for provider_config in config.get_enabled_providers("github"):
-        providers.append(GitHubProvider(config, provider_config))
+    github_configs = config.get_enabled_providers("github")
+    if github_configs:
+        from resource_manager.providers.github.core import GitHubProvider
+
+        for provider_config in github_configs:
+            providers.append(GitHubProvider(config, provider_config))
 
     # Get local providers
-    for provider_config in config.get_enabled_providers("local"):
-        providers.append(LocalProvider(config, provider_config))
+    local_configs = config.get_enabled_providers("local")
+    if local_configs:
+        from resource_manager.providers.local import LocalProvider
+
+        for provider_config in local_configs:
+            providers.append(LocalProvider(config, provider_config))
 
     return providers
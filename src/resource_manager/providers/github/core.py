@@ -1,50 +1,201 @@
+import hashlib
+import os
 import shutil
+import tempfile
+import time
+import zipfile
 import requests
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set, Tuple
+from urllib.parse import quote
 
 from resource_manager.providers.github.github_auth import (
     get_github_token,
     get_token_from_env,
     get_token_from_git_credentials,
 )
-from resource_manager.core.provider_base import Provider
+from resource_manager.providers.github.response_cache import ResponseCache
+from resource_manager.core.provider_base import (
+    Provider,
+    _NEW_FILE_MODE,
+    _pattern_predicate,
+)
 from resource_manager.core.config import Config
 
+# Concurrent raw file downloads per provider (kept low to avoid GitHub 429s)
+MAX_DOWNLOAD_WORKERS = 5
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+HTTP_POOL_SIZE = 20
+DEFAULT_CACHE_DIR = Path(".resource-manager") / "cache"
+# With strategy "auto", more files than this are fetched as one zip archive,
+# provided they make up at least ARCHIVE_MIN_SHARE of the repository's bytes
+# (the archive always contains the whole repository)
+ARCHIVE_FILE_THRESHOLD = 8
+ARCHIVE_MIN_SHARE = 0.5
+# Seconds an is_available() result is reused
+AVAILABILITY_TTL = 60
+# Contents API answers kept by exists() when the tree is truncated
+EXISTS_CACHE_SIZE = 256
+# Marks a token that has not been looked up yet
+_UNRESOLVED = object()
+
+
+@lru_cache(maxsize=128)
+def _parse_github_url(url: str) -> Tuple[str, str]:
+    """Extract owner and repo from a GitHub URL."""
+    # Expected format: https://github.com/owner/repo
+    parts = url.rstrip("/").split("/")
+    if len(parts) < 5 or parts[2] != "github.com":
+        raise ValueError(
+            "Invalid GitHub URL format. Expected: https://github.com/owner/repo"
+        )
+
+    return parts[3], parts[4]
+
+
+def _git_blob_sha(path: Path) -> Optional[str]:
+    """Compute the git blob SHA-1 of a local file, or None if unreadable."""
+    try:
+        size = os.path.getsize(path)
+        digest = hashlib.sha1(f"blob {size}\0".encode("ascii"))
+        with open(path, "rb") as f:
+            while chunk := f.read(DOWNLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+    except OSError:
+        return None
+
+
+def _clean_target(target_path: Path, keep: Set[str]) -> None:
+    """Remove everything under target_path except the relative paths in keep."""
+    for root, dirs, files in os.walk(target_path, topdown=False):
+        root_path = Path(root)
+        relative_root = root_path.relative_to(target_path).as_posix()
+        prefix = "" if relative_root == "." else f"{relative_root}/"
+        for name in files:
+            if prefix + name not in keep:
+                (root_path / name).unlink()
+        for name in dirs:
+            dir_path = root_path / name
+            if dir_path.is_symlink():
+                dir_path.unlink()
+            elif not any(dir_path.iterdir()):
+                dir_path.rmdir()
+
+
+def _resolve_token(auth_method: str) -> Optional[str]:
+    """Look up the GitHub token for an auth method."""
+    if auth_method == "default":
+        return None  # No authentication
+    if auth_method == "auto":
+        return get_github_token()  # Try env → git-credentials
+    if auth_method == "dotenv":
+        return get_token_from_env()  # Environment variables only
+    if auth_method == "gitcli":
+        return get_token_from_git_credentials()  # Git credentials only
+    return None
+
+
+@lru_cache(maxsize=None)
+def _create_session(token: Optional[str]) -> requests.Session:
+    """Create an HTTP session with connection pooling and retries.
+
+    Sessions are shared per token, so providers using the same credentials
+    reuse one connection pool to api.github.com and raw.githubusercontent.com.
+    """
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+    session.mount(
+        "https://", HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE, max_retries=retries)
+    )
+    session.headers["Accept"] = "application/vnd.github.v3+json"
+    if token:
+        session.headers["Authorization"] = f"token {token}"
+    return session
+
+
 class GitHubProvider(Provider):
     """GitHub repository resource provider."""
 
+    PROVIDER_TYPE = "github"
+
+    __slots__ = (
+        "url",
+        "owner",
+        "repo",
+        "branch",
+        "timeout",
+        "resource_dir",
+        "target_dir",
+        "strategy",
+        "_auth_method",
+        "_token",
+        "_api_base",
+        "_raw_prefix",
+        "_tree",
+        "_tree_complete",
+        "_tree_unavailable",
+        "_blob_shas",
+        "_blob_sizes",
+        "_available",
+        "_available_at",
+        "_exists_cache",
+        "_response_cache",
+    )
+
     def __init__(self, config: Config, provider_config: Dict[str, Any]):
         super().__init__(config, provider_config)
         self.url = provider_config["url"]
 
-        # Extract owner and repo from URL
-        # Expected format: https://github.com/owner/repo
-        parts = self.url.rstrip("/").split("/")
-        if len(parts) < 5 or parts[2] != "github.com":
-            raise ValueError(
-                "Invalid GitHub URL format. Expected: https://github.com/owner/repo"
-            )
-
-        self.owner = parts[3]
-        self.repo = parts[4]
+        self.owner, self.repo = _parse_github_url(self.url)
         self.branch = provider_config.get("default_branch", "main")
+        self._api_base = f"https://api.github.com/repos/{self.owner}/{self.repo}"
+        self._raw_prefix = (
+            f"https://raw.githubusercontent.com/{self.owner}/{self.repo}/{self.branch}/"
+        )
         self.timeout = provider_config.get("timeout", 10)
         self.resource_dir = provider_config.get("resource_dir", "resources")
         self.target_dir = provider_config.get("target_dir")  # Get target_dir from config
-
-        # Get GitHub token based on auth configuration
-        auth_method = config.get("auth.github.method", "auto")
-
-        if auth_method == "default":
-            self.token = None  # No authentication
-        elif auth_method == "auto":
-            self.token = get_github_token()  # Try env → git-credentials
-        elif auth_method == "dotenv":
-            self.token = get_token_from_env()  # Environment variables only
-        elif auth_method == "gitcli":
-            self.token = get_token_from_git_credentials()  # Git credentials only
+        self.strategy = provider_config.get("strategy", "auto")  # auto, zip or rest
+        self._tree: Optional[Dict[str, str]] = None  # Cached repository tree
+        self._tree_complete = False
+        self._tree_unavailable = False  # Set when exists() failed to list the tree
+        self._blob_shas: Dict[str, Optional[str]] = {}  # Blob SHA by path
+        self._blob_sizes: Dict[str, int] = {}  # Blob size by path
+        self._available: Optional[bool] = None  # Cached is_available() result
+        self._available_at = 0.0
+        self._exists_cache: "OrderedDict[str, bool]" = OrderedDict()  # By path
+
+        # GitHub token is looked up on first use (git credentials spawn a process)
+        self._auth_method = config.get("auth.github.method", "auto")
+        self._token: Any = _UNRESOLVED
+
+        # Optional on-disk cache for API responses (enabled by a "cache" section)
+        cache_config = config.get("cache")
+        if cache_config and cache_config.get("enabled", True):
+            cache_dir = cache_config.get("dir") or DEFAULT_CACHE_DIR
+            self._response_cache = ResponseCache(
+                Path(cache_dir), cache_config.get("ttl", 3600)
+            )
         else:
-            self.token = None
+            self._response_cache = None
+
+    @property
+    def token(self) -> Optional[str]:
+        """GitHub token for the configured auth method, resolved once."""
+        if self._token is _UNRESOLVED:
+            self._token = _resolve_token(self._auth_method)
+        return self._token
+
+    @property
+    def _session(self) -> requests.Session:
+        """HTTP session shared by all providers using the same token."""
+        return _create_session(self.token)
 
     def download_folder(
         self,
@@ -64,75 +215,88 @@ class GitHubProvider(Provider):
         target_path = self._ensure_target_dir(target_dir)
         downloaded_files = []
 
-        # clean 옵션 처리: 타겟 디렉터리 비우기
-        if clean and target_path.exists():
-            for item in target_path.iterdir():
-                if item.is_dir():
-                    shutil.rmtree(item)
-                else:
-                    item.unlink()
-
         try:
-            # Use Trees API to get all files recursively in one API call
-            api_url = f"https://api.github.com/repos/{self.owner}/{self.repo}/git/trees/{self.branch}"
-            params = {"recursive": "1"}  # Get full tree recursively
-
-            # Add authentication if token is available
-            headers = {}
-            if self.token:
-                headers["Authorization"] = f"token {self.token}"
-
-            response = requests.get(
-                api_url, params=params, headers=headers, timeout=self.timeout
-            )
-            response.raise_for_status()
-
-            tree_data = response.json()
-            if "tree" not in tree_data:
+            tree = self._fetch_tree()
+            if tree is None:
                 return []
 
             # Filter files that are in the resource_dir and match pattern
             resource_files = []
             resource_dir_prefix = f"{self.resource_dir}/" if self.resource_dir else ""
+            # Resolve the filename predicate once, not per tree entry
+            match_name = (
+                None if file_pattern == "*" else _pattern_predicate(file_pattern)
+            )
 
-            for item in tree_data["tree"]:
-                if item.get("type") == "blob":  # It's a file
-                    file_path = item.get("path", "")
-
-                    # Check if file is in resource directory
-                    if not resource_dir_prefix or file_path.startswith(
-                        resource_dir_prefix
-                    ):
-                        # Get relative path within resource directory
-                        if resource_dir_prefix:
-                            relative_path = file_path[len(resource_dir_prefix) :]
-                        else:
-                            relative_path = file_path
-
-                        # Skip if relative_path is empty (shouldn't happen)
-                        if not relative_path:
-                            continue
+            prefix_len = len(resource_dir_prefix)
+            append = resource_files.append
 
-                        # recursive 옵션 처리: recursive=False면 하위 폴더 파일 제외
-                        if not recursive and "/" in relative_path:
-                            continue
-                        # Check if filename matches pattern
-                        filename = relative_path.split("/")[
-                            -1
-                        ]  # Get just the filename for pattern matching
-                        if self._matches_pattern(filename, file_pattern):
-                            resource_files.append(relative_path)
+            for file_path, item_type in tree.items():
+                # Only files in the resource directory
+                if item_type != "blob" or not file_path.startswith(resource_dir_prefix):
+                    continue
+
+                # Get relative path within resource directory
+                relative_path = file_path[prefix_len:]
+                if not relative_path:
+                    continue
+
+                # recursive 옵션 처리: recursive=False면 하위 폴더 파일 제외
+                slash = relative_path.rfind("/")
+                if slash >= 0 and not recursive:
+                    continue
+
+                # Check if filename matches pattern
+                if match_name is None or match_name(relative_path[slash + 1 :]):
+                    append(relative_path)
 
             # Apply include/exclude pattern filtering
             filtered_files = self._filter_file_paths(resource_files)
 
-            # Download each filtered file using Raw URL (no additional API calls)
+            # Files whose content already matches the tree's blob SHA are
+            # kept as they are instead of being fetched again
+            blob_shas = self._blob_shas
+            pending_files = []
             for relative_path in filtered_files:
-                content = self._download_file_content_raw(relative_path)
-                if content is not None:
-                    # Preserve directory structure in target
-                    file_path = target_path / relative_path
-                    if self._save_file(file_path, content):
+                full_path = resource_dir_prefix + relative_path
+                local_sha = _git_blob_sha(target_path / relative_path)
+                if local_sha is not None and local_sha == blob_shas.get(full_path):
+                    downloaded_files.append(relative_path)
+                else:
+                    pending_files.append(relative_path)
+            filtered_files = pending_files
+
+            # clean 옵션 처리: 타겟 디렉터리 비우기 (unchanged files are kept)
+            if clean:
+                _clean_target(target_path, set(downloaded_files))
+
+            self._create_parent_dirs(target_path, filtered_files)
+
+            # Fetch many files as a single archive instead of one request each
+            if self._use_archive(filtered_files):
+                archived_files = self._download_archive(filtered_files, target_path)
+                if archived_files is not None:
+                    downloaded_files.extend(archived_files)
+                    # Files missing from the archive (e.g. the branch moved
+                    # since the tree was listed) are fetched one by one
+                    archived = set(archived_files)
+                    filtered_files = [
+                        relative_path
+                        for relative_path in filtered_files
+                        if relative_path not in archived
+                    ]
+
+            # Download filtered files concurrently using Raw URL (no additional API calls)
+            with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+                # Preserve directory structure in target
+                results = executor.map(
+                    lambda relative_path: self._download_file_raw(
+                        relative_path, target_path / relative_path
+                    ),
+                    filtered_files,
+                )
+                for relative_path, downloaded in zip(filtered_files, results):
+                    if downloaded:
                         downloaded_files.append(relative_path)
 
             return downloaded_files
@@ -146,49 +310,225 @@ class GitHubProvider(Provider):
         if not self.enabled:
             return False
 
+        # resource_dir을 고려하여 경로 설정
+        full_path = f"{self.resource_dir}/{path}" if self.resource_dir else path
+
+        # Answer from the cached tree listing when it is complete. A failed
+        # listing is not retried until refresh(); the contents API answers
+        if not self._tree_unavailable:
+            try:
+                tree = self._fetch_tree()
+            except Exception:
+                tree = None
+            if tree is None:
+                self._tree_unavailable = True
+            elif self._tree_complete:
+                return full_path in tree
+
+        if full_path in self._exists_cache:
+            return self._exists_cache[full_path]
+
         try:
-            # resource_dir을 고려하여 경로 설정
-            full_path = f"{self.resource_dir}/{path}" if self.resource_dir else path
-            api_url = f"https://api.github.com/repos/{self.owner}/{self.repo}/contents/{full_path}"
+            api_url = f"{self._api_base}/contents/{quote(full_path, safe='/')}"
 
             # 브랜치 지정
             params = {}
             if self.branch:
                 params["ref"] = self.branch
 
-            # Add authentication if token is available
-            headers = {}
-            if self.token:
-                headers["Authorization"] = f"token {self.token}"
-
-            response = requests.get(
-                api_url, params=params, headers=headers, timeout=self.timeout
-            )
-            return response.status_code == 200
+            response = self._session.get(api_url, params=params, timeout=self.timeout)
         except:
             return False
 
+        # Only definite answers are cached; errors are retried next call
+        if response.status_code in (200, 404):
+            exists_cache = self._exists_cache
+            exists_cache[full_path] = response.status_code == 200
+            if len(exists_cache) > EXISTS_CACHE_SIZE:
+                exists_cache.popitem(last=False)
+        return response.status_code == 200
+
     def is_available(self) -> bool:
         """Check if GitHub API is available."""
         if not self.enabled:
             return False
 
-        try:
-            # Add authentication if token is available
-            headers = {}
-            if self.token:
-                headers["Authorization"] = f"token {self.token}"
+        now = time.monotonic()
+        if self._available is not None and now - self._available_at < AVAILABILITY_TTL:
+            return self._available
 
-            response = requests.head(self.url, headers=headers, timeout=5)
-            return response.status_code == 200
+        # HEAD on the API repo endpoint is small and also checks the token
+        try:
+            response = self._session.head(self._api_base, timeout=5)
+            available = response.status_code == 200
         except:
+            available = False
+
+        self._available = available
+        self._available_at = now
+        return available
+
+    def refresh(self) -> None:
+        """Forget the cached tree, exists() answers and availability."""
+        self._tree = None
+        self._tree_complete = False
+        self._tree_unavailable = False
+        self._blob_shas = {}
+        self._blob_sizes = {}
+        self._exists_cache.clear()
+        self._available = None
+
+    def render_details(self, output, prefix: str, verbose: bool) -> None:
+        """Write repository details for the status command."""
+        output.line(f"{prefix}URL: {self.url}")
+        if verbose:
+            output.line(f"{prefix}Owner: {self.owner}")
+            output.line(f"{prefix}Repository: {self.repo}")
+            output.line(f"{prefix}Branch: {self.branch}")
+            output.line(f"{prefix}Resource Directory: {self.resource_dir}")
+            output.line(f"{prefix}Timeout: {self.timeout}s")
+
+    def _fetch_tree(self) -> Optional[Dict[str, str]]:
+        """Fetch the repository tree once and cache it as {path: type}.
+
+        Returns None if the response does not contain a tree listing.
+        """
+        if self._tree is not None:
+            return self._tree
+
+        # Use Trees API to get all files recursively in one API call
+        api_url = f"{self._api_base}/git/trees/{self.branch}"
+        params = {"recursive": "1"}  # Get full tree recursively
+
+        tree_data = self._get_json(api_url, params)
+        if "tree" not in tree_data:
+            return None
+
+        # Single pass over the listing; every entry carries path and type
+        tree: Dict[str, str] = {}
+        blob_shas: Dict[str, Optional[str]] = {}
+        blob_sizes: Dict[str, int] = {}
+        for item in tree_data["tree"]:
+            path = item["path"]
+            item_type = tree[path] = item["type"]
+            if item_type == "blob":
+                blob_shas[path] = item.get("sha")
+                blob_sizes[path] = item.get("size", 0)
+        self._tree = tree
+        self._blob_shas = blob_shas
+        self._blob_sizes = blob_sizes
+        # GitHub truncates very large trees; exists() falls back to the API then
+        self._tree_complete = not tree_data.get("truncated", False)
+        return self._tree
+
+    def _use_archive(self, relative_paths: List[str]) -> bool:
+        """Check if files should be fetched from the branch zip archive.
+
+        With strategy "auto" the archive is only used for many files that
+        make up a large share of the repository, since it always contains
+        the whole repository and not just resource_dir.
+        """
+        if self.strategy == "zip":
+            return bool(relative_paths)
+        if self.strategy != "auto" or len(relative_paths) <= ARCHIVE_FILE_THRESHOLD:
             return False
 
-    def _download_file_content_raw(self, relative_path: str) -> Optional[str]:
-        """Download file content using Raw URL (no API rate limit)."""
-        if not relative_path:
+        # Sizes are only known for the whole repository if the tree is complete
+        blob_sizes = self._blob_sizes
+        repo_bytes = sum(blob_sizes.values())
+        if not self._tree_complete or not repo_bytes:
+            return False
+
+        resource_dir_prefix = f"{self.resource_dir}/" if self.resource_dir else ""
+        wanted_bytes = sum(
+            blob_sizes.get(resource_dir_prefix + relative_path, 0)
+            for relative_path in relative_paths
+        )
+        return wanted_bytes >= repo_bytes * ARCHIVE_MIN_SHARE
+
+    def _download_archive(
+        self, relative_paths: List[str], target_path: Path
+    ) -> Optional[List[str]]:
+        """Download files from the branch zip archive in a single request.
+
+        Returns None if the archive could not be fetched or extracted, so the
+        caller can fall back to per-file downloads.
+        """
+        api_url = f"{self._api_base}/zipball/{self.branch}"
+        resource_dir_prefix = f"{self.resource_dir}/" if self.resource_dir else ""
+        wanted = set(relative_paths)
+        downloaded_files = []
+        temp_name = None
+
+        try:
+            with tempfile.TemporaryFile() as archive:
+                response = self._session.get(api_url, timeout=self.timeout, stream=True)
+                try:
+                    response.raise_for_status()
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        archive.write(chunk)
+                finally:
+                    response.close()
+
+                with zipfile.ZipFile(archive) as zip_file:
+                    for info in zip_file.infolist():
+                        if info.is_dir():
+                            continue
+
+                        # Entries are nested under an "{owner}-{repo}-{sha}/" folder
+                        _, _, repo_path = info.filename.partition("/")
+                        if not repo_path.startswith(resource_dir_prefix):
+                            continue
+                        relative_path = repo_path[len(resource_dir_prefix) :]
+                        if relative_path not in wanted:
+                            continue
+
+                        # Extract next to the target and rename into place,
+                        # so a failed extraction never leaves a partial file
+                        target_file = target_path / relative_path
+                        with zip_file.open(info) as source:
+                            with tempfile.NamedTemporaryFile(
+                                dir=target_file.parent, delete=False
+                            ) as temp_file:
+                                temp_name = temp_file.name
+                                shutil.copyfileobj(
+                                    source, temp_file, DOWNLOAD_CHUNK_SIZE
+                                )
+                        os.chmod(temp_name, _NEW_FILE_MODE)
+                        os.replace(temp_name, target_file)
+                        temp_name = None
+                        downloaded_files.append(relative_path)
+
+            return downloaded_files
+
+        except Exception as e:
+            print(f"Warning: Failed to download archive from GitHub: {e}")
+            if temp_name and os.path.exists(temp_name):
+                os.unlink(temp_name)
             return None
 
+    def _get_json(self, api_url: str, params: Dict[str, str]) -> Any:
+        """GET a GitHub API URL and decode the JSON body."""
+        if self._response_cache is not None:
+            return self._response_cache.get_json(
+                self._session, api_url, params, self.timeout
+            )
+
+        response = self._session.get(api_url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _download_file_raw(self, relative_path: str, target_file: Path) -> bool:
+        """Stream file from Raw URL (no API rate limit) to target_file.
+
+        The body is written in chunks to a temporary file next to the target
+        and renamed into place, so a failed download never leaves a partial
+        file. Returns True if successful.
+        """
+        if not relative_path:
+            return False
+
+        temp_name = None
         try:
             # Construct Raw URL with full relative path
             if self.resource_dir:
@@ -196,35 +536,26 @@ class GitHubProvider(Provider):
             else:
                 full_path = relative_path
 
-            raw_url = f"https://raw.githubusercontent.com/{self.owner}/{self.repo}/{self.branch}/{full_path}"
+            raw_url = self._raw_prefix + quote(full_path, safe="/")
 
-            # Add authentication if token is available
-            headers = {}
-            if self.token:
-                headers["Authorization"] = f"token {self.token}"
+            response = self._session.get(raw_url, timeout=self.timeout, stream=True)
+            try:
+                response.raise_for_status()
+                with tempfile.NamedTemporaryFile(
+                    dir=target_file.parent, delete=False
+                ) as temp_file:
+                    temp_name = temp_file.name
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        temp_file.write(chunk)
+            finally:
+                response.close()
 
-            response = requests.get(raw_url, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-            return response.text
+            os.chmod(temp_name, _NEW_FILE_MODE)
+            os.replace(temp_name, target_file)
+            return True
 
         except Exception as e:
             print(f"Failed to download file content for {relative_path}: {e}")
-            return None
-
-    def _download_file_content(self, download_url: str) -> Optional[str]:
-        """Download file content from GitHub (legacy method - still used by exists())."""
-        if not download_url:
-            return None
-
-        try:
-            # Add authentication if token is available
-            headers = {}
-            if self.token:
-                headers["Authorization"] = f"token {self.token}"
-
-            response = requests.get(download_url, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-            return response.text
-        except Exception as e:
-            print(f"Failed to download file content: {e}")
-            return None
+            if temp_name and os.path.exists(temp_name):
+                os.unlink(temp_name)
+            return False
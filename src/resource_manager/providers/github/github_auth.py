@@ -3,16 +3,29 @@
 import os
 import subprocess
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Mapping, Optional, Tuple
 
-try:
-    from dotenv import load_dotenv
+# Environment variables checked for a token, in order
+_TOKEN_ENV_VARS = ("GITHUB_TOKEN", "GH_TOKEN", "GITHUB_ACCESS_TOKEN", "GH_ACCESS_TOKEN")
+# Token prefixes of new-format GitHub tokens
+_GITHUB_TOKEN_PREFIXES = ("ghp_", "gho_", "ghu_", "ghs_", "ghr_")
+_CLASSIC_TOKEN_RE = re.compile(r"\A[a-f0-9]{40}\Z")
+_TOKEN_CHARS_RE = re.compile(r"\A[a-zA-Z0-9_-]+\Z")
+
+
+@lru_cache(maxsize=1)
+def _load_dotenv() -> None:
+    """Load the .env file into the environment, once per process."""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return  # dotenv not available, skip
 
     load_dotenv()  # Load .env file if it exists
-except ImportError:
-    pass  # dotenv not available, skip
 
 
+@lru_cache(maxsize=1)
 def get_github_token() -> Optional[str]:
     """
     Get GitHub token from various sources in order of preference.
@@ -21,6 +34,9 @@ def get_github_token() -> Optional[str]:
     1. Environment variables (GITHUB_TOKEN, GH_TOKEN, etc.)
     2. Git credential helper
 
+    The result is cached for the process; call get_github_token.cache_clear()
+    to look it up again.
+
     Returns:
         GitHub token if found, None otherwise
     """
@@ -47,24 +63,30 @@ def get_token_from_env() -> Optional[str]:
     - GITHUB_ACCESS_TOKEN
     - GH_ACCESS_TOKEN
 
+    Variables from a .env file are loaded on the first call if python-dotenv
+    is installed.
+
     Returns:
         GitHub token if found, None otherwise
     """
-    env_vars = ["GITHUB_TOKEN", "GH_TOKEN", "GITHUB_ACCESS_TOKEN", "GH_ACCESS_TOKEN"]
+    _load_dotenv()
+    environ = os.environ
 
-    for env_var in env_vars:
-        token = os.getenv(env_var)
+    for env_var in _TOKEN_ENV_VARS:
+        token = environ.get(env_var)
         if token and _is_valid_github_token(token):
             return token
 
     return None
 
 
+@lru_cache(maxsize=1)
 def get_token_from_git_credentials() -> Optional[str]:
     """
     Get GitHub token from git credential helper.
 
-    Uses 'git credential fill' to get credentials for github.com.
+    Uses 'git credential fill' to get credentials for github.com. The
+    subprocess runs once per process; the result is cached.
 
     Returns:
         GitHub token if available, None otherwise
@@ -144,15 +166,12 @@ def _is_valid_github_token(token: str) -> bool:
     if not token or len(token) < 20:
         return False
 
-    # Check for GitHub token prefixes
-    github_prefixes = ["ghp_", "gho_", "ghu_", "ghs_", "ghr_"]
-
     # New format tokens (start with specific prefixes)
-    if any(token.startswith(prefix) for prefix in github_prefixes):
+    if token.startswith(_GITHUB_TOKEN_PREFIXES):
         return len(token) >= 36  # New tokens are typically 36+ chars
 
     # Classic tokens (40 character hex strings)
-    if len(token) == 40 and re.match(r"^[a-f0-9]{40}$", token):
+    if len(token) == 40 and _CLASSIC_TOKEN_RE.match(token):
         return True
 
     # Fine-grained personal access tokens (start with github_pat_)
@@ -161,12 +180,49 @@ def _is_valid_github_token(token: str) -> bool:
 
     # If it's long enough and contains reasonable characters, accept it
     # (to handle future token formats)
-    if len(token) >= 20 and re.match(r"^[a-zA-Z0-9_-]+$", token):
+    if len(token) >= 20 and _TOKEN_CHARS_RE.match(token):
         return True
 
     return False
 
 
+@lru_cache(maxsize=1)
+def _api_session():
+    """HTTP session for api.github.com, created on first use."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return session
+
+
+@lru_cache(maxsize=8)
+def _fetch_user(token: str) -> Tuple[int, Optional[dict], Mapping[str, str]]:
+    """
+    Fetch /user for a token once and cache the answer.
+
+    Only 200 and 401 answers are cached. Network errors and any other
+    status (rate limits, server errors) are raised, so they are not cached.
+
+    Returns:
+        Status code, decoded body (None unless 200) and response headers
+    """
+    import requests
+
+    headers = {"Authorization": f"token {token}"}
+    response = _api_session().get(
+        "https://api.github.com/user", headers=headers, timeout=10
+    )
+    if response.status_code not in (200, 401):
+        raise requests.HTTPError(
+            f"Unexpected status {response.status_code} from GitHub /user",
+            response=response,
+        )
+    body = response.json() if response.status_code == 200 else None
+    return response.status_code, body, response.headers
+
+
 def validate_token(token: str) -> bool:
     """
     Validate GitHub token by making a test API call.
@@ -181,14 +237,8 @@ def validate_token(token: str) -> bool:
         return False
 
     try:
-        import requests
-
-        headers = {"Authorization": f"token {token}"}
-        response = requests.get(
-            "https://api.github.com/user", headers=headers, timeout=10
-        )
-
-        return response.status_code == 200
+        status_code, _, _ = _fetch_user(token)
+        return status_code == 200
 
     except Exception:
         return False
@@ -208,15 +258,9 @@ def get_authenticated_user(token: str) -> Optional[dict]:
         return None
 
     try:
-        import requests
-
-        headers = {"Authorization": f"token {token}"}
-        response = requests.get(
-            "https://api.github.com/user", headers=headers, timeout=10
-        )
-
-        if response.status_code == 200:
-            return response.json()
+        _, user, _ = _fetch_user(token)
+        # Copy so callers cannot modify the cached body
+        return dict(user) if user is not None else None
 
     except Exception:
         pass
@@ -238,16 +282,11 @@ def check_token_scopes(token: str) -> list:
         return []
 
     try:
-        import requests
-
-        headers = {"Authorization": f"token {token}"}
-        response = requests.get(
-            "https://api.github.com/user", headers=headers, timeout=10
-        )
+        status_code, _, headers = _fetch_user(token)
 
-        if response.status_code == 200:
+        if status_code == 200:
             # GitHub returns scopes in the X-OAuth-Scopes header
-            scopes_header = response.headers.get("X-OAuth-Scopes", "")
+            scopes_header = headers.get("X-OAuth-Scopes", "")
             if scopes_header:
                 return [scope.strip() for scope in scopes_header.split(",")]
 
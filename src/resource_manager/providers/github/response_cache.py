@@ -0,0 +1,101 @@
+"""On-disk cache for GitHub API responses."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+
+from resource_manager.core.provider_base import _NEW_FILE_MODE
+
+
+class ResponseCache:
+    """Cache JSON API responses on disk and revalidate them with ETags.
+
+    Entries younger than ttl seconds are served without a request. Older
+    entries are revalidated with If-None-Match; a 304 response refreshes
+    the entry without transferring the body again.
+    """
+
+    def __init__(self, cache_dir: Path, ttl: int = 3600):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    def get_json(
+        self,
+        session: requests.Session,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        timeout: int = 10,
+    ) -> Any:
+        """GET url and return the decoded JSON body, using the cache."""
+        cache_file = self._cache_file(url, params)
+        entry = self._read(cache_file)
+
+        if entry is not None and time.time() - entry["fetched_at"] < self.ttl:
+            return entry["body"]
+
+        headers = {}
+        if entry is not None and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+
+        response = session.get(url, params=params, headers=headers, timeout=timeout)
+        if response.status_code == 304 and entry is not None:
+            entry["fetched_at"] = time.time()
+            self._write(cache_file, entry)
+            return entry["body"]
+
+        response.raise_for_status()
+        body = response.json()
+        self._write(
+            cache_file,
+            {
+                "etag": response.headers.get("ETag"),
+                "fetched_at": time.time(),
+                "body": body,
+            },
+        )
+        return body
+
+    def _cache_file(self, url: str, params: Optional[Dict[str, str]]) -> Path:
+        """Get cache file path for a request."""
+        key = json.dumps([url, sorted((params or {}).items())])
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json"
+
+    def _read(self, cache_file: Path) -> Optional[Dict[str, Any]]:
+        """Read cache entry. Returns None if missing, unreadable or malformed."""
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(entry, dict)
+            or not isinstance(entry.get("fetched_at"), (int, float))
+            or "body" not in entry
+        ):
+            return None
+        return entry
+
+    def _write(self, cache_file: Path, entry: Dict[str, Any]) -> None:
+        """Write cache entry atomically. Failures are ignored."""
+        temp_name = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.cache_dir, delete=False
+            ) as f:
+                temp_name = f.name
+                json.dump(entry, f)
+            os.chmod(temp_name, _NEW_FILE_MODE)
+            os.replace(temp_name, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Failed to write response cache {cache_file}: {e}")
+            if temp_name and os.path.exists(temp_name):
+                os.unlink(temp_name)
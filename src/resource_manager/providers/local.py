@@ -1,14 +1,84 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Optional
 import shutil
+import stat
+import tempfile
+import threading
 
-from resource_manager.core.provider_base import Provider
+from resource_manager.core.provider_base import Provider, _pattern_predicate
 from resource_manager.core.config import Config
 
+# File copies are I/O bound, so allow more workers than CPUs
+MAX_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _path_predicate(file_pattern: str, anchored: bool) -> Callable[[str], bool]:
+    """Build a predicate matching relative paths against a "/" pattern.
+
+    Each pattern component matches one path component, so "*" never
+    crosses a "/". Like Path.glob("**/<pattern>"), the pattern matches the
+    trailing components of the path; with anchored it must match the
+    whole path, like Path.glob("<pattern>").
+    """
+    part_matches = [_pattern_predicate(part) for part in file_pattern.split("/")]
+    count = len(part_matches)
+
+    def match(rel_path: str) -> bool:
+        parts = rel_path.split("/")
+        if len(parts) < count or (anchored and len(parts) != count):
+            return False
+        return all(m(part) for m, part in zip(part_matches, parts[-count:]))
+
+    return match
+
+
+def _clear_directory(target_path: Path) -> Optional[threading.Thread]:
+    """Empty target_path, deleting the old contents in a background thread.
+
+    Entries are renamed into a sibling trash directory, which is cheap, and
+    the returned thread removes the trash while files are being copied.
+    Entries that cannot be moved are deleted in place.
+    """
+    target_path = target_path.resolve()
+    try:
+        trash = Path(
+            tempfile.mkdtemp(
+                prefix=f".{target_path.name}.trash-", dir=target_path.parent
+            )
+        )
+    except OSError:
+        trash = None
+
+    for item in target_path.iterdir():
+        if trash is not None:
+            try:
+                os.rename(item, trash / item.name)
+                continue
+            except OSError:
+                pass
+        if item.is_dir() and not item.is_symlink():
+            shutil.rmtree(item)
+        else:
+            item.unlink()
+
+    if trash is None:
+        return None
+    cleanup = threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}
+    )
+    cleanup.start()
+    return cleanup
+
 
 class LocalProvider(Provider):
     """Local filesystem resource provider."""
 
+    PROVIDER_TYPE = "local"
+
+    __slots__ = ("base_path",)
+
     def __init__(self, config: Config, provider_config: Dict[str, Any]):
         super().__init__(config, provider_config)
         self.base_path = Path(provider_config["path"])
@@ -25,51 +95,27 @@ class LocalProvider(Provider):
             return []
 
         target_path = self._ensure_target_dir(target_dir)
-        copied_files = []
 
         # clean 옵션 처리: 타겟 디렉터리 비우기
+        cleanup = None
         if clean and target_path.exists():
-            for item in target_path.iterdir():
-                if item.is_dir():
-                    shutil.rmtree(item)
-                else:
-                    item.unlink()
+            cleanup = _clear_directory(target_path)
 
         try:
-            # recursive 옵션 처리
-            if recursive:
-                if file_pattern == "*":
-                    glob_pattern = "**/*"  # All files recursively
-                else:
-                    glob_pattern = f"**/{file_pattern}"  # Pattern in any subdirectory
-            else:
-                if file_pattern == "*":
-                    glob_pattern = "*"  # Only top-level files
-                else:
-                    glob_pattern = file_pattern  # Only top-level matching files
-
-            matching_files = []
-            for file_path in self.base_path.glob(glob_pattern):
-                if file_path.is_file():
-                    rel_path = str(file_path.relative_to(self.base_path))
-                    matching_files.append(rel_path)
+            matching_files = self._list_files(file_pattern, recursive)
 
             # Filter files based on include/exclude patterns
             filtered_files = self._filter_file_paths(matching_files)
 
-            # Copy each filtered file
-            for rel_path in filtered_files:
-                source_file = self.base_path / rel_path
-                target_file = target_path / rel_path
+            self._create_parent_dirs(target_path, filtered_files)
 
-                try:
-                    # Ensure target directory exists
-                    target_file.parent.mkdir(parents=True, exist_ok=True)
-                    # Copy file
-                    shutil.copy2(source_file, target_file)
-                    copied_files.append(rel_path)
-                except Exception as e:
-                    print(f"Warning: Failed to copy file {rel_path}: {e}")
+            # Copy filtered files concurrently
+            with ThreadPoolExecutor(max_workers=MAX_COPY_WORKERS) as executor:
+                results = executor.map(
+                    lambda rel_path: self._copy_file(rel_path, target_path),
+                    filtered_files,
+                )
+                copied_files = [rel_path for rel_path in results if rel_path]
 
             return copied_files
 
@@ -77,6 +123,75 @@ class LocalProvider(Provider):
             print(f"Warning: Failed to copy folder: {e}")
             return []
 
+        finally:
+            # Old contents are gone before the command reports back
+            if cleanup is not None:
+                cleanup.join()
+
+    def _list_files(self, file_pattern: str, recursive: bool) -> List[str]:
+        """List files matching file_pattern, relative to base_path.
+
+        Directories matched by the exclude patterns are pruned during the
+        walk instead of having their files filtered out afterwards. A
+        negated ("!") pattern may re-include files below an excluded
+        directory, so with one present nothing is pruned and
+        _filter_file_paths decides.
+        """
+        exclude_match = self._exclude_match
+        if any(p.startswith("!") for p in self._exclude_patterns):
+            exclude_match = None
+
+        match_name = match_path = None
+        max_depth = None if recursive else 0
+        if "/" in file_pattern:
+            match_path = _path_predicate(file_pattern, anchored=not recursive)
+            if not recursive:
+                # Only descend as deep as the pattern reaches
+                max_depth = file_pattern.count("/")
+        elif file_pattern != "*":
+            match_name = _pattern_predicate(file_pattern)
+        matching_files = []
+        stack = [("", str(self.base_path))]
+
+        while stack:
+            prefix, directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        rel_path = prefix + entry.name
+                        if entry.is_dir():
+                            # Like Path.glob, do not follow symlinked directories
+                            if entry.is_symlink() or (
+                                max_depth is not None and prefix.count("/") >= max_depth
+                            ):
+                                continue
+                            dir_path = rel_path + "/"
+                            if exclude_match is None or not exclude_match(dir_path):
+                                stack.append((dir_path, entry.path))
+                        elif (
+                            entry.is_file()
+                            and (match_name is None or match_name(entry.name))
+                            and (match_path is None or match_path(rel_path))
+                        ):
+                            matching_files.append(rel_path)
+            except PermissionError:
+                continue
+
+        return matching_files
+
+    def _copy_file(self, rel_path: str, target_path: Path) -> Optional[str]:
+        """Copy a single file. Returns rel_path if successful."""
+        source_file = self.base_path / rel_path
+        target_file = target_path / rel_path
+
+        try:
+            # Copy file (parent directories are created by download_folder)
+            shutil.copy2(source_file, target_file)
+            return rel_path
+        except Exception as e:
+            print(f"Warning: Failed to copy file {rel_path}: {e}")
+            return None
+
     def exists(self, path: str) -> bool:
         """Check if resource exists in local filesystem"""
         if not self.enabled:
@@ -88,3 +203,28 @@ class LocalProvider(Provider):
     def is_available(self) -> bool:
         """Check if local path is available."""
         return self.enabled and self.base_path.exists()
+
+    def render_details(self, output, prefix: str, verbose: bool) -> None:
+        """Write source path details for the status command."""
+        output.line(f"{prefix}Path: {self.base_path}")
+        if not verbose:
+            return
+
+        # One stat answers both "exists" and "is a directory"
+        try:
+            is_dir = stat.S_ISDIR(os.stat(self.base_path).st_mode)
+            path_exists = True
+        except OSError:
+            is_dir = path_exists = False
+
+        path_status = "exists" if path_exists else "missing"
+        path_color = "info" if path_exists else "error"
+        output.line(f"{prefix}Path Status: <{path_color}>{path_status}</{path_color}>")
+
+        if is_dir:
+            try:
+                with os.scandir(self.base_path) as entries:
+                    file_count = sum(1 for _ in entries)
+                output.line(f"{prefix}Files: {file_count}")
+            except Exception:
+                output.line(f"{prefix}Files: Unable to count")
@@ -3,6 +3,7 @@
 import json
 import pytest
 from unittest.mock import patch, MagicMock
+from cleo.application import Application
 from cleo.testers.command_tester import CommandTester
 
 from resource_manager.cli.commands.config_command import ConfigCommand
@@ -188,7 +189,7 @@ class TestConfigCommand:
 class TestDownloadCommand:
     """Test DownloadCommand."""
 
-    @patch("resource_manager.cli.commands.download_command.get_provider")
+    @patch("resource_manager.cli.commands.download_command.get_provider_by_name")
     @patch("resource_manager.cli.commands.download_command.ConfigManager")
     def test_download_provider_not_found(
         self, mock_config_manager, mock_get_provider, tmp_path
@@ -230,6 +231,77 @@ class TestDownloadCommand:
         assert exit_code == 1
         assert "Target path is a file" in tester.io.fetch_error()
 
+    @patch("resource_manager.cli.commands.download_command.ConfigManager")
+    def test_download_target_not_empty(self, mock_config_manager, tmp_path):
+        """Test download refuses a non-empty target without --force."""
+        (tmp_path / "existing.txt").write_text("existing file")
+
+        mock_manager = MagicMock()
+        mock_manager.load_config.return_value = Config({})
+        mock_config_manager.return_value = mock_manager
+
+        command = DownloadCommand()
+
+        tester = CommandTester(command)
+        exit_code = tester.execute(f"test-provider {tmp_path}")
+
+        assert exit_code == 1
+        assert "Target directory is not empty" in tester.io.fetch_error()
+
+    @patch("resource_manager.cli.commands.download_command.get_all_providers")
+    @patch("resource_manager.cli.commands.download_command.ConfigManager")
+    def test_download_all_providers(
+        self, mock_config_manager, mock_get_all_providers, tmp_path
+    ):
+        """Test download from all providers with one failing provider."""
+        mock_manager = MagicMock()
+        mock_manager.load_config.return_value = MagicMock()
+        mock_config_manager.return_value = mock_manager
+
+        providers = []
+        for name, target in [("first", "a"), ("second", "b"), ("third", "a")]:
+            provider = MagicMock()
+            provider.name = name
+            provider.enabled = True
+            provider.is_available.return_value = True
+            provider.target_dir = str(tmp_path / target)
+            provider.download_folder.return_value = [f"{name}.txt"]
+            providers.append(provider)
+        providers[1].download_folder.side_effect = RuntimeError("boom")
+        mock_get_all_providers.return_value = providers
+
+        # --quiet is an application-level option
+        command = DownloadCommand()
+        Application().add(command)
+
+        tester = CommandTester(command)
+        exit_code = tester.execute("all")
+
+        assert exit_code == 1
+        output = tester.io.fetch_output()
+        assert "Total files downloaded: 2" in output
+        assert "second: boom" in output
+        assert "Failed to download from 'second'" in tester.io.fetch_error()
+
+    def test_group_by_target_merges_nested_dirs(self, tmp_path):
+        """Test providers with nested target directories share a group."""
+        from resource_manager.cli.commands.download_command import _group_by_target
+
+        providers = []
+        for target in ["a/x", "b", "a", "a-b", None]:
+            provider = MagicMock()
+            provider.target_dir = str(tmp_path / target) if target else None
+            providers.append(provider)
+
+        groups = _group_by_target(providers, None)
+        assert groups == [
+            [providers[0], providers[2]],
+            [providers[1]],
+            [providers[3]],
+            [providers[4]],
+        ]
+        assert _group_by_target(providers, str(tmp_path)) == [providers]
+
 
 class TestStatusCommand:
     """Test StatusCommand."""
@@ -242,7 +314,7 @@ class TestStatusCommand:
         mock_provider = MagicMock()
         mock_provider.name = "test-provider"
         mock_provider.enabled = True
-        mock_provider.__class__.__name__ = "GitHubProvider"
+        mock_provider.PROVIDER_TYPE = "github"
         mock_get_all_providers.return_value = [mock_provider]
 
         # Setup mock config manager
@@ -259,7 +331,39 @@ class TestStatusCommand:
         assert "Provider Status Overview" in output
         assert "test-provider" in output
 
-    @patch("resource_manager.cli.commands.status_command.get_provider")
+    @patch("resource_manager.cli.commands.status_command.get_all_providers")
+    @patch("resource_manager.cli.commands.status_command.ConfigManager")
+    def test_status_check_connection(self, mock_config_manager, mock_get_all_providers):
+        """Test connection check probes each provider once."""
+        providers = []
+        for name, result in [("up", True), ("down", False), ("broken", None)]:
+            provider = MagicMock()
+            provider.name = name
+            provider.enabled = True
+            provider.is_available.return_value = result
+            providers.append(provider)
+        providers[2].is_available.side_effect = RuntimeError("boom")
+        mock_get_all_providers.return_value = providers
+
+        mock_manager = MagicMock()
+        mock_manager.load_config.return_value = MagicMock()
+        mock_config_manager.return_value = mock_manager
+
+        # --verbose is an application-level option
+        command = StatusCommand()
+        Application().add(command)
+
+        tester = CommandTester(command)
+        exit_code = tester.execute("--check-connection")
+
+        assert exit_code == 0
+        output = tester.io.fetch_output()
+        assert "Available providers: 1" in output
+        assert "Error - boom" in output
+        for provider in providers:
+            provider.is_available.assert_called_once()
+
+    @patch("resource_manager.cli.commands.status_command.get_provider_by_name")
     @patch("resource_manager.cli.commands.status_command.ConfigManager")
     def test_status_specific_provider(self, mock_config_manager, mock_get_provider):
         """Test status command for specific provider."""
@@ -267,7 +371,7 @@ class TestStatusCommand:
         mock_provider = MagicMock()
         mock_provider.name = "test-provider"
         mock_provider.enabled = True
-        mock_provider.__class__.__name__ = "GitHubProvider"
+        mock_provider.PROVIDER_TYPE = "github"
         mock_get_provider.return_value = mock_provider
 
         # Setup mock config manager
@@ -283,8 +387,9 @@ class TestStatusCommand:
         # assert exit_code == 0
         output = tester.io.fetch_output()
         assert "Provider: test-provider" in output
+        assert "Type: github" in output
 
-    @patch("resource_manager.cli.commands.status_command.get_provider")
+    @patch("resource_manager.cli.commands.status_command.get_provider_by_name")
     @patch("resource_manager.cli.commands.status_command.ConfigManager")
     def test_status_provider_not_found(self, mock_config_manager, mock_get_provider):
         """Test status command with non-existent provider."""
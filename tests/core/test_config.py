@@ -3,7 +3,12 @@
 import json
 from pathlib import Path
 import pytest
-from resource_manager.core.config import Config, ConfigManager
+from resource_manager.core.config import (
+    Config,
+    ConfigManager,
+    _parse_path,
+    default_config_dir,
+)
 
 
 @pytest.fixture
@@ -71,6 +76,15 @@ def test_config_validation(sample_config):
             }
         })
 
+    # Mutations are validated on demand, not on every set()
+    config.set("providers.local[1]", {"name": "no-path"})
+    with pytest.raises(ValueError, match="Local provider must have a path"):
+        config.validate()
+    config.set("providers.local[1].path", "./other")
+    config.set("auth.github.method", "unknown")
+    with pytest.raises(ValueError, match="Invalid auth method"):
+        config.validate()
+
 
 def test_config_get_set(sample_config):
     """Test getting and setting configuration values."""
@@ -90,6 +104,27 @@ def test_config_get_set(sample_config):
     assert config.get("new.key") == "value"
 
 
+def test_config_dot_path_parsing(sample_config):
+    """Test dot-notation path parsing and array index access."""
+    assert _parse_path("providers.github[0].name") == (
+        ("providers", None),
+        ("github", 0),
+        ("name", None),
+    )
+    assert _parse_path("providers.github[0].name") is _parse_path(
+        "providers.github[0].name"
+    )
+
+    config = Config(sample_config)
+    assert config.get("providers.github[5].name", "missing") == "missing"
+    assert config.get("providers.github[-1].name") == "test-github"
+    assert config.get("providers.github[-5].name", "missing") == "missing"
+    assert config.get("cache.enabled.deeper", "missing") == "missing"
+
+    config.set("providers.local[1]", {"name": "second", "path": "./second"})
+    assert config.get("providers.local[1].name") == "second"
+
+
 def test_config_providers(sample_config):
     """Test provider-related methods."""
     config = Config(sample_config)
@@ -108,6 +143,16 @@ def test_config_providers(sample_config):
     enabled_providers = config.get_enabled_providers("github")
     assert len(enabled_providers) == 0
 
+    # Test lookup by type and name
+    assert config.get_provider_config("github", "test-github") is github_providers[0]
+    assert config.get_provider_config("local", "test-github") is None
+
+    # Lookups see providers added through set() and edited in place
+    config.set("providers.local[1]", {"name": "extra", "path": "./extra"})
+    assert config.get_provider_config("local", "extra")["path"] == "./extra"
+    config.get_providers("local").append({"name": "appended", "path": "./a"})
+    assert config.get_provider_config("local", "appended")["path"] == "./a"
+
 
 def test_config_manager_save_load(config_manager, sample_config):
     """Test saving and loading configuration."""
@@ -130,3 +175,62 @@ def test_config_manager_create_sample(config_manager):
     
     # Auth 섹션 확인
     assert config.get("auth.github.method") == "auto"
+
+
+def test_config_manager_reload_is_independent(tmp_path, sample_config):
+    """Test repeated loads return independent configs and see saved changes."""
+    config_manager = ConfigManager(config_dir=tmp_path)
+    config_manager.save_config(Config(sample_config))
+
+    first = config_manager.load_config()
+    first.set("cache.ttl", 1)
+    second = config_manager.load_config()
+    assert second.get("cache.ttl") == 3600
+
+    first.set("providers.github[0].name", "renamed")
+    config_manager.save_config(first)
+    assert config_manager.load_config().get("providers.github[0].name") == "renamed"
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_config_manager_save_validates_changes(tmp_path, sample_config):
+    """Test save_config validates a config changed since construction."""
+    config_manager = ConfigManager(config_dir=tmp_path)
+    config = Config(sample_config)
+    assert config_manager.validate_config(config)
+    config.set("auth.github.method", "unknown")
+    assert not config_manager.validate_config(config)
+
+    with pytest.raises(RuntimeError, match="Invalid auth method"):
+        config_manager.save_config(config)
+    assert not config_manager.config_path.exists()
+
+    # Edits made in place through returned containers are validated too
+    config.set("auth.github.method", "auto")
+    config.get_providers("github").append({"name": "no-url"})
+    assert not config_manager.validate_config(config)
+    with pytest.raises(RuntimeError, match="GitHub provider must have a URL"):
+        config_manager.save_config(config)
+
+
+def test_config_manager_info(tmp_path, sample_config):
+    """Test configuration info for missing and saved configs."""
+    config_manager = ConfigManager(config_dir=tmp_path)
+    info = config_manager.get_config_info()
+    assert info["exists"] is False
+    assert info["valid"] is False
+
+    config_manager.save_config(Config(sample_config))
+    info = config_manager.get_config_info()
+    assert info["exists"] is True
+    assert info["valid"] is True
+    assert info["has_providers"] is True
+
+
+def test_default_config_dir_follows_cwd(tmp_path, monkeypatch):
+    """Test the default config dir is resolved against the current cwd."""
+    monkeypatch.chdir(tmp_path)
+    assert default_config_dir() == tmp_path / ".resource-manager"
+    (tmp_path / "other").mkdir()
+    monkeypatch.chdir(tmp_path / "other")
+    assert default_config_dir() == tmp_path / "other" / ".resource-manager"
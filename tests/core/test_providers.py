@@ -1,11 +1,16 @@
 """Tests for resource providers."""
 
 import pytest
-from unittest.mock import patch
+from unittest.mock import patch, MagicMock
 
 from resource_manager.core.config import Config
+from resource_manager.core.provider_base import _NEW_FILE_MODE
 
-from resource_manager.core.provider_getter import get_provider, get_all_providers
+from resource_manager.core.provider_getter import (
+    get_provider,
+    get_provider_by_name,
+    get_all_providers,
+)
 from resource_manager.providers.local import LocalProvider
 from resource_manager.providers.github.core import GitHubProvider
 
@@ -96,6 +101,88 @@ def test_local_provider_download_folder(local_provider, tmp_path):
     assert (target_dir / "test2.txt").read_text() == "content 2"
 
 
+def test_local_provider_clean_removes_old_contents(local_provider, tmp_path):
+    """Test clean empties the target without leaving a trash directory."""
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "new.txt").write_text("new")
+
+    target_dir = tmp_path / "target"
+    (target_dir / "old_dir").mkdir(parents=True)
+    (target_dir / "old_dir" / "old.txt").write_text("old")
+    (target_dir / "new.txt").write_text("stale")
+
+    local_provider.base_path = source_dir
+    downloaded_files = local_provider.download_folder(str(target_dir), clean=True)
+
+    assert downloaded_files == ["new.txt"]
+    assert [p.name for p in target_dir.iterdir()] == ["new.txt"]
+    assert (target_dir / "new.txt").read_text() == "new"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["source", "target"]
+
+
+def test_local_provider_skips_excluded_dirs(local_provider, tmp_path):
+    """Test LocalProvider walks nested dirs and prunes excluded ones."""
+    source_dir = tmp_path / "source"
+    (source_dir / "nested").mkdir(parents=True)
+    (source_dir / ".git").mkdir()
+    (source_dir / "top.txt").write_text("top")
+    (source_dir / "nested" / "inner.txt").write_text("inner")
+    (source_dir / ".git" / "ignored.txt").write_text("ignored")
+    local_provider.base_path = source_dir
+
+    target_dir = tmp_path / "target"
+    downloaded_files = local_provider.download_folder(str(target_dir))
+    assert sorted(downloaded_files) == ["nested/inner.txt", "top.txt"]
+    assert (target_dir / "nested" / "inner.txt").read_text() == "inner"
+
+    downloaded_files = local_provider.download_folder(
+        str(target_dir), recursive=False
+    )
+    assert downloaded_files == ["top.txt"]
+
+
+def test_local_provider_negated_exclude_keeps_file(tmp_path):
+    """Test a negated exclude pattern re-includes a file in an excluded dir."""
+    source_dir = tmp_path / "source"
+    (source_dir / "build").mkdir(parents=True)
+    (source_dir / "build" / "keep.txt").write_text("keep")
+    (source_dir / "build" / "drop.txt").write_text("drop")
+    (source_dir / "top.txt").write_text("top")
+    config = Config(
+        {
+            "providers": {
+                "local": [{"name": "local", "enabled": True, "path": str(source_dir)}]
+            },
+            "resources": {"exclude_patterns": ["build/", "!build/keep.txt"]},
+        }
+    )
+    provider = LocalProvider(config, config.get_providers("local")[0])
+
+    downloaded_files = provider.download_folder(str(tmp_path / "target"))
+    assert sorted(downloaded_files) == ["build/keep.txt", "top.txt"]
+
+
+def test_local_provider_path_pattern(local_provider, tmp_path):
+    """Test a file_pattern with "/" matches trailing path components."""
+    source_dir = tmp_path / "source"
+    (source_dir / "sub").mkdir(parents=True)
+    (source_dir / "deep" / "sub").mkdir(parents=True)
+    (source_dir / "x.txt").write_text("x")
+    (source_dir / "sub" / "y.txt").write_text("y")
+    (source_dir / "deep" / "sub" / "z.txt").write_text("z")
+    local_provider.base_path = source_dir
+    target_dir = tmp_path / "target"
+
+    downloaded_files = local_provider.download_folder(str(target_dir), "sub/*.txt")
+    assert sorted(downloaded_files) == ["deep/sub/z.txt", "sub/y.txt"]
+
+    downloaded_files = local_provider.download_folder(
+        str(target_dir), "sub/*.txt", recursive=False
+    )
+    assert downloaded_files == ["sub/y.txt"]
+
+
 def test_local_provider_basic_functionality(local_provider, tmp_path):
     """Test basic LocalProvider functionality."""
     # Setup test files
@@ -115,7 +202,7 @@ def test_local_provider_basic_functionality(local_provider, tmp_path):
     assert local_provider.is_available()
 
 
-@patch("requests.get")
+@patch("requests.Session.get")
 def test_github_provider_basic_functionality(mock_get, github_provider):
     """Test basic GitHubProvider functionality."""
     # Mock exists check
@@ -128,6 +215,290 @@ def test_github_provider_basic_functionality(mock_get, github_provider):
     mock_get.return_value.status_code = 404
     assert not github_provider.exists("nonexistent.txt")
 
+    # Earlier answers are remembered
+    assert github_provider.exists("test.txt")
+
+    # refresh() forgets them
+    github_provider.refresh()
+    assert not github_provider.exists("test.txt")
+
+
+@patch("requests.Session.get")
+def test_github_provider_exists_skips_failed_tree(mock_get, github_provider):
+    """Test a failed tree listing is not retried on every exists() call."""
+    requested = []
+
+    def fake_get(url, **kwargs):
+        requested.append(url)
+        response = MagicMock()
+        if "/git/trees/" in url:
+            response.raise_for_status.side_effect = Exception("rate limited")
+        else:
+            response.status_code = 200
+        return response
+
+    mock_get.side_effect = fake_get
+
+    assert github_provider.exists("a.txt")
+    assert github_provider.exists("b.txt")
+    assert sum("/git/trees/" in url for url in requested) == 1
+    assert sum("/contents/" in url for url in requested) == 2
+
+
+def test_github_providers_share_session(github_provider, github_provider_real):
+    """Test providers with the same token share one pooled session."""
+    assert github_provider.token == github_provider_real.token
+    assert github_provider._session is github_provider_real._session
+
+
+@patch("resource_manager.providers.github.core.get_github_token")
+def test_github_provider_resolves_token_lazily(mock_get_token, sample_config):
+    """Test the token is looked up on first use, not on construction."""
+    mock_get_token.return_value = "ghp_" + "a" * 36
+    provider = GitHubProvider(sample_config, sample_config.get_providers("github")[0])
+    mock_get_token.assert_not_called()
+
+    assert provider.token == "ghp_" + "a" * 36
+    assert provider.token == "ghp_" + "a" * 36
+    mock_get_token.assert_called_once()
+
+
+@patch("requests.Session.head")
+def test_github_provider_is_available_cached(mock_head, github_provider):
+    """Test is_available pings the API once and reuses the result."""
+    mock_head.return_value.status_code = 200
+
+    assert github_provider.is_available()
+    assert github_provider.is_available()
+
+    assert mock_head.call_count == 1
+    assert mock_head.call_args.args[0].startswith("https://api.github.com/repos/")
+
+
+@patch("requests.Session.get")
+def test_github_provider_download_folder(mock_get, github_provider, tmp_path):
+    """Test GitHubProvider download_folder with mocked API responses."""
+    tree_response = MagicMock()
+    tree_response.json.return_value = {
+        "tree": [
+            {"type": "blob", "path": "resources/a.txt"},
+            {"type": "tree", "path": "resources/sub"},
+            {"type": "blob", "path": "resources/sub/b.txt"},
+            {"type": "blob", "path": "resources/c.pyc"},
+            {"type": "blob", "path": "other/d.txt"},
+        ]
+    }
+
+    def fake_get(url, **kwargs):
+        if "/git/trees/" in url:
+            return tree_response
+        response = MagicMock()
+        content = f"content of {url.rsplit('/', 1)[-1]}".encode()
+        response.iter_content.return_value = [content[:4], content[4:]]
+        return response
+
+    mock_get.side_effect = fake_get
+    target_dir = tmp_path / "target"
+
+    downloaded_files = github_provider.download_folder(str(target_dir))
+
+    assert sorted(downloaded_files) == ["a.txt", "sub/b.txt"]
+    assert (target_dir / "a.txt").read_text() == "content of a.txt"
+    assert (target_dir / "sub" / "b.txt").read_text() == "content of b.txt"
+    # Temp files are renamed into place with the usual umask-based mode
+    assert (target_dir / "a.txt").stat().st_mode & 0o777 == _NEW_FILE_MODE
+
+    # Non-recursive download skips nested files
+    downloaded_files = github_provider.download_folder(
+        str(target_dir), recursive=False
+    )
+    assert downloaded_files == ["a.txt"]
+
+    # exists() is answered from the cached tree without extra requests
+    call_count = mock_get.call_count
+    assert github_provider.exists("sub/b.txt")
+    assert github_provider.exists("sub")
+    assert not github_provider.exists("missing.txt")
+    assert mock_get.call_count == call_count
+
+
+@patch("requests.Session.get")
+def test_github_provider_skips_unchanged_files(mock_get, github_provider, tmp_path):
+    """Test files matching the tree's blob SHA are not fetched again."""
+    from resource_manager.providers.github.core import _git_blob_sha
+
+    target_dir = tmp_path / "target"
+    target_dir.mkdir()
+    (target_dir / "same.txt").write_text("same")
+    (target_dir / "old.txt").write_text("old")
+
+    tree_response = MagicMock()
+    tree_response.json.return_value = {
+        "tree": [
+            {
+                "type": "blob",
+                "path": "resources/same.txt",
+                "sha": _git_blob_sha(target_dir / "same.txt"),
+            },
+            {"type": "blob", "path": "resources/old.txt", "sha": "0" * 40},
+        ]
+    }
+    fetched = []
+
+    def fake_get(url, **kwargs):
+        if "/git/trees/" in url:
+            return tree_response
+        fetched.append(url.rsplit("/", 1)[-1])
+        response = MagicMock()
+        response.iter_content.return_value = [b"new"]
+        return response
+
+    mock_get.side_effect = fake_get
+
+    downloaded_files = github_provider.download_folder(str(target_dir), clean=False)
+
+    assert sorted(downloaded_files) == ["old.txt", "same.txt"]
+    assert fetched == ["old.txt"]
+    assert (target_dir / "old.txt").read_text() == "new"
+
+
+@patch("requests.Session.get")
+def test_github_provider_clean_keeps_unchanged_files(
+    mock_get, github_provider, tmp_path
+):
+    """Test clean removes stale files but keeps files matching the tree."""
+    from resource_manager.providers.github.core import _git_blob_sha
+
+    target_dir = tmp_path / "target"
+    (target_dir / "stale").mkdir(parents=True)
+    (target_dir / "same.txt").write_text("same")
+    (target_dir / "stale" / "gone.txt").write_text("gone")
+
+    tree_response = MagicMock()
+    tree_response.json.return_value = {
+        "tree": [
+            {
+                "type": "blob",
+                "path": "resources/same.txt",
+                "sha": _git_blob_sha(target_dir / "same.txt"),
+            },
+            {"type": "blob", "path": "resources/new.txt", "sha": "0" * 40},
+        ]
+    }
+    fetched = []
+
+    def fake_get(url, **kwargs):
+        if "/git/trees/" in url:
+            return tree_response
+        fetched.append(url.rsplit("/", 1)[-1])
+        response = MagicMock()
+        response.iter_content.return_value = [b"new"]
+        return response
+
+    mock_get.side_effect = fake_get
+
+    downloaded_files = github_provider.download_folder(str(target_dir), clean=True)
+
+    assert sorted(downloaded_files) == ["new.txt", "same.txt"]
+    assert fetched == ["new.txt"]
+    assert sorted(p.name for p in target_dir.iterdir()) == ["new.txt", "same.txt"]
+
+
+@patch("requests.Session.get")
+def test_github_provider_download_archive(mock_get, sample_config, tmp_path):
+    """Test GitHubProvider fetches files from the zip archive."""
+    import io
+    import zipfile
+
+    provider_config = dict(sample_config.get_providers("github")[0], strategy="zip")
+    provider = GitHubProvider(sample_config, provider_config)
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("test-repo-abc123/resources/a.txt", "archived a")
+        zip_file.writestr("test-repo-abc123/resources/sub/b.txt", "archived b")
+        zip_file.writestr("test-repo-abc123/other/c.txt", "not a resource")
+
+    tree_response = MagicMock()
+    tree_response.json.return_value = {
+        "tree": [
+            {"type": "blob", "path": "resources/a.txt"},
+            {"type": "blob", "path": "resources/sub/b.txt"},
+            {"type": "blob", "path": "other/c.txt"},
+        ]
+    }
+    archive_response = MagicMock()
+    archive_response.iter_content.return_value = [archive.getvalue()]
+    mock_get.side_effect = lambda url, **kwargs: (
+        archive_response if "/zipball/" in url else tree_response
+    )
+
+    target_dir = tmp_path / "target"
+    downloaded_files = provider.download_folder(str(target_dir))
+
+    assert sorted(downloaded_files) == ["a.txt", "sub/b.txt"]
+    assert (target_dir / "sub" / "b.txt").read_text() == "archived b"
+    assert (target_dir / "sub" / "b.txt").stat().st_mode & 0o777 == _NEW_FILE_MODE
+    assert not (target_dir / "c.txt").exists()
+
+
+@patch("requests.Session.get")
+def test_github_provider_archive_falls_back_for_missing_files(
+    mock_get, sample_config, tmp_path
+):
+    """Test files listed in the tree but missing from the archive are fetched raw."""
+    import io
+    import zipfile
+
+    provider_config = dict(sample_config.get_providers("github")[0], strategy="zip")
+    provider = GitHubProvider(sample_config, provider_config)
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("test-repo-abc123/resources/a.txt", "archived a")
+
+    tree_response = MagicMock()
+    tree_response.json.return_value = {
+        "tree": [
+            {"type": "blob", "path": "resources/a.txt"},
+            {"type": "blob", "path": "resources/b.txt"},
+        ]
+    }
+    archive_response = MagicMock()
+    archive_response.iter_content.return_value = [archive.getvalue()]
+    raw_response = MagicMock()
+    raw_response.iter_content.return_value = [b"raw b"]
+
+    def fake_get(url, **kwargs):
+        if "/zipball/" in url:
+            return archive_response
+        if "/git/trees/" in url:
+            return tree_response
+        return raw_response
+
+    mock_get.side_effect = fake_get
+
+    target_dir = tmp_path / "target"
+    downloaded_files = provider.download_folder(str(target_dir))
+
+    assert sorted(downloaded_files) == ["a.txt", "b.txt"]
+    assert (target_dir / "a.txt").read_text() == "archived a"
+    assert (target_dir / "b.txt").read_text() == "raw b"
+    assert sorted(p.name for p in target_dir.iterdir()) == ["a.txt", "b.txt"]
+
+
+@pytest.mark.parametrize("other_size, expected", [(10, True), (10**6, False)])
+def test_github_provider_auto_archive_by_size(sample_config, other_size, expected):
+    """Test strategy "auto" only uses the archive when resources dominate the repo."""
+    provider = GitHubProvider(sample_config, sample_config.get_providers("github")[0])
+    provider._blob_sizes = {f"resources/{i}.txt": 100 for i in range(9)}
+    provider._blob_sizes["other/data.bin"] = other_size
+    provider._tree_complete = True
+
+    relative_paths = [f"{i}.txt" for i in range(9)]
+    assert provider._use_archive(relative_paths) is expected
+    assert not provider._use_archive(relative_paths[:8])
+
 
 @pytest.mark.integration
 def test_github_provider_real_exists(github_provider_real):
@@ -178,6 +549,11 @@ def test_get_provider(sample_config):
     assert isinstance(provider, GitHubProvider)
     assert provider.name == "test-github"
 
+    # Test get_provider_by_name
+    provider = get_provider_by_name(sample_config, "test-local")
+    assert isinstance(provider, LocalProvider)
+    assert get_provider_by_name(sample_config, "missing") is None
+
     # Test get_all_providers
     providers = get_all_providers(sample_config)
     assert len(providers) == 3
@@ -185,6 +561,24 @@ def test_get_provider(sample_config):
     assert any(isinstance(p, LocalProvider) for p in providers)
 
 
+def test_provider_render_details(sample_config, github_provider, tmp_path):
+    """Test providers write their own status details."""
+    (tmp_path / "a.txt").write_text("a")
+    local_provider = LocalProvider(
+        sample_config, {"name": "tmp-local", "path": str(tmp_path)}
+    )
+    output = MagicMock()
+
+    local_provider.render_details(output, "  ", verbose=True)
+    lines = [call.args[0] for call in output.line.call_args_list]
+    assert lines[0] == f"  Path: {tmp_path}"
+    assert "  Files: 1" in lines
+
+    output.reset_mock()
+    github_provider.render_details(output, "", verbose=False)
+    output.line.assert_called_once_with(f"URL: {github_provider.url}")
+
+
 def test_pattern_filtering(local_provider, tmp_path):
     """Test file pattern filtering."""
     # Setup test files
@@ -224,3 +618,66 @@ def test_github_provider_auth_integration(sample_config):
 
     # 실제 auth 함수가 호출됨
     provider = GitHubProvider(config, provider_config)
+
+
+def test_compiled_patterns_match_pathspec():
+    """Test combined pattern regex agrees with PathSpec matching."""
+    from pathspec import PathSpec
+    from pathspec.patterns import GitWildMatchPattern
+    from resource_manager.core.provider_base import _compile_patterns
+
+    paths = ["a.txt", "b/c.md", ".git/config", "x/__pycache__/m.pyc", "keep.txt"]
+    for patterns in (
+        ["*.txt", "*.md"],
+        [".git", "__pycache__", "*.pyc"],
+        ["*.txt", "!keep.txt"],
+    ):
+        match = _compile_patterns(tuple(patterns))
+        spec = PathSpec.from_lines(GitWildMatchPattern, patterns)
+        assert [match(p) for p in paths] == [spec.match_file(p) for p in paths]
+
+    assert _compile_patterns(()) is None
+
+
+def test_response_cache_revalidates_with_etag(tmp_path):
+    """Test ResponseCache serves fresh entries and revalidates stale ones."""
+    from resource_manager.providers.github.response_cache import ResponseCache
+
+    session = MagicMock()
+    first = MagicMock(status_code=200, headers={"ETag": '"abc"'})
+    first.json.return_value = {"tree": []}
+    session.get.return_value = first
+
+    cache = ResponseCache(tmp_path, ttl=3600)
+    assert cache.get_json(session, "https://api.github.com/x") == {"tree": []}
+    assert cache.get_json(session, "https://api.github.com/x") == {"tree": []}
+    assert session.get.call_count == 1  # Second call served from cache
+
+    # Stale entry is revalidated; 304 reuses the cached body
+    session.get.return_value = MagicMock(status_code=304)
+    stale_cache = ResponseCache(tmp_path, ttl=0)
+    assert stale_cache.get_json(session, "https://api.github.com/x") == {"tree": []}
+    assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+
+def test_response_cache_ignores_malformed_entries(tmp_path):
+    """Test ResponseCache treats malformed entries as misses and cleans up."""
+    from resource_manager.providers.github.response_cache import ResponseCache
+
+    session = MagicMock()
+    response = MagicMock(status_code=200, headers={})
+    response.json.return_value = {"tree": []}
+    session.get.return_value = response
+
+    cache = ResponseCache(tmp_path, ttl=3600)
+    url = "https://api.github.com/x"
+    cache._cache_file(url, None).write_text('{"etag": "abc"}')
+    assert cache.get_json(session, url) == {"tree": []}
+    assert session.get.call_count == 1
+    assert cache._cache_file(url, None).stat().st_mode & 0o777 == _NEW_FILE_MODE
+
+    # An entry that cannot be serialized leaves no temp file behind
+    cache._write(tmp_path / "bad.json", {"fetched_at": 0, "body": object()})
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        cache._cache_file(url, None).name
+    ]
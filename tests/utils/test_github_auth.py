@@ -4,6 +4,11 @@ from unittest.mock import patch, MagicMock
 from resource_manager.providers.github.github_auth import (
     get_github_token,
     get_token_from_git_credentials,
+    get_authenticated_user,
+    check_token_scopes,
+    validate_token,
+    _fetch_user,
+    _is_valid_github_token,
 )
 
 
@@ -49,3 +54,71 @@ def test_get_github_token_real():
     else:
         # 토큰이 없어도 정상 (환경에 따라 다름)
         assert token is None
+
+
+@patch("resource_manager.providers.github.github_auth.subprocess.run")
+def test_get_token_from_git_credentials_cached(mock_run):
+    """Test git credential fill runs once per process."""
+    token = "ghp_" + "a" * 36
+    mock_run.return_value = MagicMock(returncode=0, stdout=f"password={token}\n")
+    get_token_from_git_credentials.cache_clear()
+    try:
+        assert get_token_from_git_credentials() == token
+        assert get_token_from_git_credentials() == token
+        mock_run.assert_called_once()
+    finally:
+        get_token_from_git_credentials.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "token, expected",
+    [
+        ("ghp_" + "a" * 36, True),
+        ("ghp_short", False),
+        ("0123456789abcdef" * 2 + "01234567", True),
+        ("github_pat_" + "a" * 40, True),
+        ("future-token_format_1", True),
+        ("token with spaces in it", False),
+        ("future-token_format_1\n", False),
+        ("", False),
+    ],
+)
+def test_is_valid_github_token(token, expected):
+    """Test token format validation."""
+    assert _is_valid_github_token(token) is expected
+
+
+@patch("requests.Session.get")
+def test_user_checks_share_one_request(mock_get):
+    """Test token checks reuse a single /user response."""
+    mock_get.return_value.status_code = 200
+    mock_get.return_value.json.return_value = {"login": "octocat"}
+    mock_get.return_value.headers = {"X-OAuth-Scopes": "repo, read:org"}
+    _fetch_user.cache_clear()
+    try:
+        assert validate_token("token")
+        assert get_authenticated_user("token") == {"login": "octocat"}
+        assert check_token_scopes("token") == ["repo", "read:org"]
+        mock_get.assert_called_once()
+    finally:
+        _fetch_user.cache_clear()
+
+
+@patch("requests.Session.get")
+def test_user_check_errors_are_not_cached(mock_get):
+    """Test only 200 and 401 /user answers are cached."""
+    mock_get.return_value.status_code = 503
+    _fetch_user.cache_clear()
+    try:
+        assert not validate_token("token")
+        assert get_authenticated_user("token") is None
+        assert mock_get.call_count == 2
+
+        mock_get.return_value.status_code = 200
+        mock_get.return_value.json.return_value = {"login": "octocat"}
+        user = get_authenticated_user("token")
+        user["login"] = "changed"
+        assert get_authenticated_user("token") == {"login": "octocat"}
+        assert mock_get.call_count == 3
+    finally:
+        _fetch_user.cache_clear()